@@ -119,7 +119,7 @@ def search_english_rhymes(request: EnglishSearchRequest) -> EnglishSearchRespons
 
         vowel_pattern, consonant_pattern, is_prefix, is_suffix = extract_patterns(parsed)
 
-        candidates = english_index.search_by_pattern(
+        candidates = english_index.iter_search_by_pattern(
             vowel_pattern=vowel_pattern,
             consonant_pattern=consonant_pattern,
             prefix=is_prefix,
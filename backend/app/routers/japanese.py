@@ -55,7 +55,7 @@ def search_rhymes(request: PatternSearchRequest) -> PatternSearchResponse:
 
         vowel_pattern, consonant_pattern, is_prefix, is_suffix = extract_patterns(parsed)
 
-        candidates = index.search_by_pattern(
+        candidates = index.iter_search_by_pattern(
             vowel_pattern=vowel_pattern,
             consonant_pattern=consonant_pattern,
             prefix=is_prefix,
@@ -2,11 +2,14 @@
 
 import atexit
 import sqlite3
+from collections.abc import Iterator
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import Self
 
+_FETCH_BATCH_SIZE = 256
+
 
 @dataclass
 class EnglishIndexEntry:
@@ -61,6 +64,19 @@ class EnglishRhymeIndex:
         Returns:
             List of matching entries
         """
+        return list(
+            self.iter_search_by_pattern(vowel_pattern, consonant_pattern, prefix, suffix, limit)
+        )
+
+    def iter_search_by_pattern(
+        self,
+        vowel_pattern: str | None = None,
+        consonant_pattern: str | None = None,
+        prefix: bool = False,
+        suffix: bool = False,
+        limit: int = 10000,
+    ) -> Iterator[EnglishIndexEntry]:
+        """Lazily yield entries matching a pattern (see search_by_pattern)."""
         conn = self._get_conn()
         conditions = []
         params: list[str | int] = []
@@ -111,7 +127,7 @@ class EnglishRhymeIndex:
                 params,
             )
 
-        return [self._row_to_entry(row) for row in cursor]
+        yield from self._iter_rows(cursor)
 
     def search_by_vowels(self, pattern: str, limit: int = 100) -> list[EnglishIndexEntry]:
         """Search by vowel pattern suffix match."""
@@ -133,7 +149,7 @@ class EnglishRhymeIndex:
             """,
             (pattern, limit),
         )
-        return [self._row_to_entry(row) for row in cursor]
+        return list(self._iter_rows(cursor))
 
     def get_total_count(self) -> int:
         """Get total number of entries in the index."""
@@ -141,6 +157,12 @@ class EnglishRhymeIndex:
         cursor = conn.execute("SELECT COUNT(*) FROM english_words")
         return cursor.fetchone()[0]
 
+    def _iter_rows(self, cursor: sqlite3.Cursor) -> Iterator[EnglishIndexEntry]:
+        """Convert rows to entries lazily, fetching from SQLite in batches."""
+        while rows := cursor.fetchmany(_FETCH_BATCH_SIZE):
+            for row in rows:
+                yield self._row_to_entry(row)
+
     def _row_to_entry(self, row: sqlite3.Row) -> EnglishIndexEntry:
         return EnglishIndexEntry(
             word=row["word"],
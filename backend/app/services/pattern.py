@@ -13,15 +13,17 @@ Examples:
 """
 
 import logging
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
 
-from app.services.phoneme import Phoneme, extract_phonemes, hiragana_to_katakana
+from app.services.phoneme import extract_phonemes, hiragana_to_katakana
 from app.services.rhyme import IndexEntry
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ParsedPhonemePattern:
     """Parsed single phoneme pattern element"""
 
@@ -29,13 +31,34 @@ class ParsedPhonemePattern:
     vowel: str | None  # None = any, "a" etc = specific
 
 
-@dataclass
+@dataclass(frozen=True)
 class ParsedPattern:
     """Parsed pattern"""
 
     prefix_wildcard: bool  # Starts with *
     suffix_wildcard: bool  # Ends with *
-    phoneme_patterns: list[ParsedPhonemePattern]  # Pattern elements between wildcards
+    phoneme_patterns: tuple[ParsedPhonemePattern, ...]  # Pattern elements between wildcards
+    # Derived from phoneme_patterns: (offset, value) for every non-wildcard slot, so
+    # match() only compares the fixed positions, and the match score (which depends
+    # only on the pattern's specificity)
+    fixed_consonants: tuple[tuple[int, str], ...] = field(init=False, repr=False, compare=False)
+    fixed_vowels: tuple[tuple[int, str], ...] = field(init=False, repr=False, compare=False)
+    score: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        patterns = self.phoneme_patterns
+        fixed_consonants = tuple(
+            (i, p.consonant) for i, p in enumerate(patterns) if p.consonant is not None
+        )
+        fixed_vowels = tuple((i, p.vowel) for i, p in enumerate(patterns) if p.vowel is not None)
+        score = 100
+        if fixed_consonants or fixed_vowels:
+            # More specific patterns get higher scores (max 2 checks per phoneme)
+            specificity = (len(fixed_consonants) + len(fixed_vowels)) / (len(patterns) * 2)
+            score = int(50 + 50 * specificity)
+        object.__setattr__(self, "fixed_consonants", fixed_consonants)
+        object.__setattr__(self, "fixed_vowels", fixed_vowels)
+        object.__setattr__(self, "score", score)
 
 
 class PatternMatcher:
@@ -44,13 +67,16 @@ class PatternMatcher:
     # Consonant characters (in patterns, these represent consonants)
     CONSONANTS = frozenset("kgsztdnhbpmyrwfcjqNQ")
 
-    # Multi-character consonants (sh, ch, ts) are handled separately in parse()
-
     # Consonants that can combine with 'y' to form youon (拗音)
     # e.g., ky (きゃ), gy (ぎゃ), ny (にゃ), hy (ひゃ), by (びゃ), py (ぴゃ), my (みゃ), ry (りゃ)
     # Note: sh, ch, j already represent palatalized sounds and don't take additional 'y'
     YOUON_BASE_CONSONANTS = frozenset("kgnhbpmr")
 
+    # Two-character consonants, matched longest-first with one set lookup in parse()
+    MULTI_CHAR_CONSONANTS = frozenset(
+        ["sh", "ch", "ts"] + [base + "y" for base in YOUON_BASE_CONSONANTS]
+    )
+
     # Pure vowels (can appear without a consonant)
     PURE_VOWELS = frozenset("aiueo")
 
@@ -66,82 +92,11 @@ class PatternMatcher:
         Returns:
             ParsedPattern with parsed structure
         """
-        prefix_wildcard = pattern.startswith("*")
-        suffix_wildcard = pattern.endswith("*")
-
-        # Remove wildcards from ends
-        core = pattern.strip("*")
-        if not core:
-            return ParsedPattern(
-                prefix_wildcard=prefix_wildcard,
-                suffix_wildcard=suffix_wildcard,
-                phoneme_patterns=[],
-            )
-
-        phoneme_patterns: list[ParsedPhonemePattern] = []
-        i = 0
-        while i < len(core):
-            char = core[i]
-
-            if char == "_":
-                # Check if followed by a vowel
-                if i + 1 < len(core) and core[i + 1] in self.VOWELS:
-                    # _ + vowel = any consonant + specific vowel
-                    phoneme_patterns.append(ParsedPhonemePattern(consonant=None, vowel=core[i + 1]))
-                    i += 2
-                else:
-                    # Just _ = any single phoneme
-                    phoneme_patterns.append(ParsedPhonemePattern(consonant=None, vowel=None))
-                    i += 1
-
-            elif char in self.CONSONANTS:
-                # Consonant - check for following vowel or wildcard
-                consonant = char
-                # Handle multi-character consonants
-                if i + 1 < len(core):
-                    next_char = core[i + 1]
-                    if char == "s" and next_char == "h":
-                        consonant = "sh"
-                        i += 1
-                    elif char == "c" and next_char == "h":
-                        consonant = "ch"
-                        i += 1
-                    elif char == "t" and next_char == "s":
-                        consonant = "ts"
-                        i += 1
-                    elif next_char == "y" and char in self.YOUON_BASE_CONSONANTS:
-                        # 拗音: ky, gy, ny, hy, by, py, my, ry
-                        consonant = char + "y"
-                        i += 1
-
-                i += 1
-                # Check for vowel after consonant
-                if i < len(core) and core[i] in self.VOWELS:
-                    vowel = core[i]
-                    i += 1
-                    phoneme_patterns.append(ParsedPhonemePattern(consonant=consonant, vowel=vowel))
-                elif i < len(core) and core[i] == "_":
-                    # Consonant + any vowel
-                    phoneme_patterns.append(ParsedPhonemePattern(consonant=consonant, vowel=None))
-                    i += 1
-                else:
-                    # Consonant only (match any vowel)
-                    phoneme_patterns.append(ParsedPhonemePattern(consonant=consonant, vowel=None))
-
-            elif char in self.PURE_VOWELS:
-                # Pure vowel only (no consonant) - aiueo only, not 'n'
-                phoneme_patterns.append(ParsedPhonemePattern(consonant="", vowel=char))
-                i += 1
-
-            else:
-                logger.warning(f"Unknown character in pattern: {char!r}")
-                i += 1
-
-        return ParsedPattern(
-            prefix_wildcard=prefix_wildcard,
-            suffix_wildcard=suffix_wildcard,
-            phoneme_patterns=phoneme_patterns,
-        )
+        parsed, unknown_chars = _parse_pattern(pattern)
+        # Logged here rather than in the cached parse, so every request with a bad pattern logs
+        for char in unknown_chars:
+            logger.warning(f"Unknown character in pattern: {char!r}")
+        return parsed
 
     def match(self, candidate: IndexEntry, parsed: ParsedPattern) -> tuple[bool, int]:
         """Check if a candidate matches the pattern.
@@ -160,87 +115,152 @@ class PatternMatcher:
             return False, 0
 
         # Extract candidate's phonemes
-        candidate_phonemes = extract_phonemes(candidate.reading)
-        if not candidate_phonemes:
+        consonants, vowels = _candidate_phonemes(candidate.reading)
+        if not consonants:
             return False, 0
 
         pattern_len = len(parsed.phoneme_patterns)
-        candidate_len = len(candidate_phonemes)
+        candidate_len = len(consonants)
 
         # Check if pattern can possibly match
         if not parsed.prefix_wildcard and not parsed.suffix_wildcard:
             # Exact length match required
             if candidate_len != pattern_len:
                 return False, 0
-            return self._match_at_position(candidate_phonemes, parsed.phoneme_patterns, 0)
+            start = 0
 
-        if parsed.prefix_wildcard and parsed.suffix_wildcard:
+        elif parsed.prefix_wildcard and parsed.suffix_wildcard:
             # Pattern can appear anywhere
             for start in range(candidate_len - pattern_len + 1):
-                matches, score = self._match_at_position(
-                    candidate_phonemes, parsed.phoneme_patterns, start
-                )
-                if matches:
-                    return True, score
+                if self._match_at_position(consonants, vowels, parsed, start):
+                    return True, parsed.score
+            return False, 0
 
         elif parsed.suffix_wildcard:
             # Pattern must match at start
             if candidate_len < pattern_len:
                 return False, 0
-            return self._match_at_position(candidate_phonemes, parsed.phoneme_patterns, 0)
+            start = 0
 
         else:
             # parsed.prefix_wildcard: Pattern must match at end
             if candidate_len < pattern_len:
                 return False, 0
             start = candidate_len - pattern_len
-            return self._match_at_position(candidate_phonemes, parsed.phoneme_patterns, start)
 
+        if self._match_at_position(consonants, vowels, parsed, start):
+            return True, parsed.score
         return False, 0
 
     def _match_at_position(
         self,
-        candidate_phonemes: list[Phoneme],
-        pattern: list[ParsedPhonemePattern],
+        consonants: tuple[str, ...],
+        vowels: tuple[str | None, ...],
+        parsed: ParsedPattern,
         start: int,
-    ) -> tuple[bool, int]:
-        """Check if pattern matches at a specific position.
+    ) -> bool:
+        """Check if the pattern's fixed slots match the candidate at a specific position.
 
-        Returns:
-            Tuple of (matches: bool, score: int)
-            Score is based on how specific the match is (0-100)
+        The caller guarantees the pattern fits at start; wildcard slots are skipped
+        entirely since only the fixed (offset, value) pairs are compared.
         """
-        score = 100
-        exact_matches = 0
-        total_checks = 0
+        for offset, consonant in parsed.fixed_consonants:
+            if consonants[start + offset] != consonant:
+                return False
+        # Explicit loops: all() with a generator is markedly slower in this hot path
+        for offset, vowel in parsed.fixed_vowels:  # noqa: SIM110
+            if vowels[start + offset] != vowel:
+                return False
+        return True
+
+
+@lru_cache(maxsize=65536)
+def _candidate_phonemes(reading: str) -> tuple[tuple[str, ...], tuple[str | None, ...]]:
+    """Consonant and vowel tokens of a candidate reading, shared across matches.
+
+    Phoneme extraction dominates match(); the same readings come back as candidates
+    for every search with a similar pattern.
+    """
+    phonemes = extract_phonemes(reading)
+    return tuple(p.consonant for p in phonemes), tuple(p.vowel for p in phonemes)
 
-        for i, p in enumerate(pattern):
-            if start + i >= len(candidate_phonemes):
-                return False, 0
 
-            cand = candidate_phonemes[start + i]
-
-            # Check consonant
-            if p.consonant is not None:
-                total_checks += 1
-                if p.consonant != cand.consonant:
-                    return False, 0
-                exact_matches += 1
-
-            # Check vowel
-            if p.vowel is not None:
-                total_checks += 1
-                if p.vowel != cand.vowel:
-                    return False, 0
-                exact_matches += 1
-
-        # Calculate score based on match specificity
-        if total_checks > 0:
-            # More specific patterns get higher scores
-            specificity = exact_matches / (len(pattern) * 2)  # max 2 checks per phoneme
-            score = int(50 + 50 * specificity)
+@lru_cache(maxsize=4096)
+def _parse_pattern(pattern: str) -> tuple[ParsedPattern, tuple[str, ...]]:
+    """Parse a pattern string; the result is immutable, so it is shared across calls.
+
+    Returns:
+        Tuple of (parsed pattern, unknown characters skipped while parsing)
+    """
+    prefix_wildcard = pattern.startswith("*")
+    suffix_wildcard = pattern.endswith("*")
+
+    # Remove wildcards from ends
+    core = pattern.strip("*")
+    if not core:
+        parsed = ParsedPattern(
+            prefix_wildcard=prefix_wildcard,
+            suffix_wildcard=suffix_wildcard,
+            phoneme_patterns=(),
+        )
+        return parsed, ()
+
+    phoneme_patterns: list[ParsedPhonemePattern] = []
+    unknown_chars: list[str] = []
+    i = 0
+    while i < len(core):
+        char = core[i]
+
+        if char == "_":
+            # Check if followed by a vowel
+            if i + 1 < len(core) and core[i + 1] in PatternMatcher.VOWELS:
+                # _ + vowel = any consonant + specific vowel
+                phoneme_patterns.append(ParsedPhonemePattern(consonant=None, vowel=core[i + 1]))
+                i += 2
+            else:
+                # Just _ = any single phoneme
+                phoneme_patterns.append(ParsedPhonemePattern(consonant=None, vowel=None))
+                i += 1
+
+        elif char in PatternMatcher.CONSONANTS:
+            # Consonant - check for following vowel or wildcard
+            consonant = char
+            # Multi-character consonants: sh, ch, ts and 拗音 (ky, gy, ny, hy, by, py, my, ry)
+            pair = core[i : i + 2]
+            if pair in PatternMatcher.MULTI_CHAR_CONSONANTS:
+                # Slices are fresh objects; intern so match() compares by identity
+                consonant = sys.intern(pair)
+                i += 1
+
+            i += 1
+            # Check for vowel after consonant
+            if i < len(core) and core[i] in PatternMatcher.VOWELS:
+                vowel = core[i]
+                i += 1
+                phoneme_patterns.append(ParsedPhonemePattern(consonant=consonant, vowel=vowel))
+            elif i < len(core) and core[i] == "_":
+                # Consonant + any vowel
+                phoneme_patterns.append(ParsedPhonemePattern(consonant=consonant, vowel=None))
+                i += 1
+            else:
+                # Consonant only (match any vowel)
+                phoneme_patterns.append(ParsedPhonemePattern(consonant=consonant, vowel=None))
+
+        elif char in PatternMatcher.PURE_VOWELS:
+            # Pure vowel only (no consonant) - aiueo only, not 'n'
+            phoneme_patterns.append(ParsedPhonemePattern(consonant="", vowel=char))
+            i += 1
+
+        else:
+            unknown_chars.append(char)
+            i += 1
 
-        return True, score
+    parsed = ParsedPattern(
+        prefix_wildcard=prefix_wildcard,
+        suffix_wildcard=suffix_wildcard,
+        phoneme_patterns=tuple(phoneme_patterns),
+    )
+    return parsed, tuple(unknown_chars)
 
 
 def build_pattern_from_reading(
@@ -260,33 +280,30 @@ def build_pattern_from_reading(
     Returns:
         Pattern string
     """
-    katakana = hiragana_to_katakana(reading)
-    phonemes = extract_phonemes(katakana)
+    # Same cached token tuples the matcher uses for candidates
+    consonants, vowels = _candidate_phonemes(hiragana_to_katakana(reading))
 
     if fix_consonants is None:
-        fix_consonants = [True] * len(phonemes)
+        fix_consonants = [True] * len(consonants)
     if fix_vowels is None:
-        fix_vowels = [True] * len(phonemes)
+        fix_vowels = [True] * len(consonants)
 
     parts = []
-    for i, phoneme in enumerate(phonemes):
+    for i, (cons, vowel) in enumerate(zip(consonants, vowels, strict=True)):
         cons_fixed = fix_consonants[i] if i < len(fix_consonants) else True
         vowel_fixed = fix_vowels[i] if i < len(fix_vowels) else True
+        vowel = vowel or ""
 
         if not cons_fixed and not vowel_fixed:
             parts.append("_")
         elif cons_fixed and vowel_fixed:
             # Both fixed
-            cons = phoneme.consonant or ""
-            vowel = phoneme.vowel or ""
             parts.append(cons + vowel)
         elif cons_fixed:
             # Consonant fixed, vowel any
-            cons = phoneme.consonant or ""
             parts.append(cons + "_" if cons else "_")
         else:
             # Vowel fixed, consonant any
-            vowel = phoneme.vowel or ""
             parts.append("_" + vowel if vowel else "_")
 
     pattern_core = "".join(parts)
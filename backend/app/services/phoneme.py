@@ -1,4 +1,6 @@
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 
 # 小書き仮名（拗音用、モーラカウント時にスキップ）
 SMALL_KANA = frozenset("ャュョァィゥェォ")
@@ -242,9 +244,10 @@ def extract_phonemes(katakana: str) -> list[Phoneme]:
             prev = phonemes[-1]
             # 拗音（ャ、ュ、ョ）の場合、子音に 'y' を追加
             # ただし sh, ch, j など既に拗音的な子音の場合は追加しない
+            # 連結で生成される子音（ky など）は intern し、パターン照合の比較を同一性判定で済ませる
             new_consonant = prev.consonant
             if char in YOUON_SMALL_KANA and prev.consonant not in PALATALIZED_CONSONANTS:
-                new_consonant = prev.consonant + "y"
+                new_consonant = sys.intern(prev.consonant + "y")
             phonemes[-1] = Phoneme(
                 vowel=vowel,
                 consonant=new_consonant,
@@ -294,58 +297,80 @@ def get_initial_consonant(katakana: str) -> str:
     return CONSONANT_MAP.get(first_char, "")
 
 
+@lru_cache(maxsize=65536)
 def analyze(katakana: str) -> PhonemeAnalysis:
-    """カタカナ文字列を解析し、母音・子音パターンを返す"""
-    phonemes = extract_phonemes(katakana)
+    """カタカナ文字列を解析し、母音・子音パターンを返す
 
-    vowels = "-".join(p.vowel for p in phonemes if p.vowel)
-    consonants = "-".join(p.consonant for p in phonemes if p.consonant)
-    mora_count = count_morae(katakana)
-    initial_consonant = get_initial_consonant(katakana)
+    extract_phonemes / count_morae と同じ規則を、Phoneme を生成せずに1パスで適用する
+    （インデックス構築時に全単語で呼ばれるホットパス）。
+    同音異義語など同じ読みは頻出するため、結果（不変）を読みごとにキャッシュする。
+    """
+    vowel_list: list[str | None] = []
+    consonant_list: list[str] = []
+    mora_count = 0
+    prev_vowel: str | None = None
+
+    for char in katakana:
+        is_small = char in SMALL_KANA
+        if not is_small and (char in VOWEL_MAP or char in CONSONANT_MAP):
+            mora_count += 1
+
+        if char == "ー" and prev_vowel:
+            # 長音: 直前の母音を繰り返す
+            vowel_list.append(prev_vowel)
+            consonant_list.append("")
+            continue
+
+        vowel = VOWEL_MAP.get(char)
+
+        # 小書き仮名の処理（キャ、シュなどの拗音）: 直前の音素を置き換える
+        if is_small and vowel_list:
+            prev_consonant = consonant_list[-1]
+            if char in YOUON_SMALL_KANA and prev_consonant not in PALATALIZED_CONSONANTS:
+                consonant_list[-1] = prev_consonant + "y"
+            vowel_list[-1] = vowel
+            prev_vowel = vowel
+            continue
+
+        consonant = CONSONANT_MAP.get(char, "")
+        if vowel is not None or consonant:
+            vowel_list.append(vowel)
+            consonant_list.append(consonant)
+            prev_vowel = vowel
 
     return PhonemeAnalysis(
         reading=katakana,
-        vowels=vowels,
-        consonants=consonants,
+        vowels="-".join(v for v in vowel_list if v),
+        consonants="-".join(c for c in consonant_list if c),
         mora_count=mora_count,
-        initial_consonant=initial_consonant,
+        initial_consonant=get_initial_consonant(katakana),
     )
 
 
+# ひらがな（0x3041-0x3096）とカタカナ（0x30A1-0x30F6）は 0x60 離れて並んでいる
+_KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(0x30A1, 0x30F7)}
+_HIRAGANA_TO_KATAKANA = {code: code + 0x60 for code in range(0x3041, 0x3097)}
+# ひらがなと長音符を削除する表（残る文字がなければひらがなのみ）
+_DELETE_HIRAGANA = dict.fromkeys([*range(0x3041, 0x3097), ord("ー")])
+
+
 def katakana_to_hiragana(text: str) -> str:
     """カタカナをひらがなに変換する"""
-    result = []
-    for char in text:
-        code = ord(char)
-        if 0x30A1 <= code <= 0x30F6:
-            result.append(chr(code - 0x60))
-        else:
-            result.append(char)
-    return "".join(result)
+    return text.translate(_KATAKANA_TO_HIRAGANA)
 
 
 def hiragana_to_katakana(text: str) -> str:
     """ひらがなをカタカナに変換する"""
-    result = []
-    for char in text:
-        code = ord(char)
-        if 0x3041 <= code <= 0x3096:
-            result.append(chr(code + 0x60))
-        else:
-            result.append(char)
-    return "".join(result)
+    return text.translate(_HIRAGANA_TO_KATAKANA)
 
 
 def is_hiragana(text: str) -> bool:
     """文字列がひらがなのみで構成されているか判定"""
-    for char in text:
-        code = ord(char)
-        # ひらがな範囲（0x3041-0x3096）と長音符（ー）を許可
-        if not (0x3041 <= code <= 0x3096 or char == "ー"):
-            return False
-    return len(text) > 0
+    # ひらがな範囲（0x3041-0x3096）と長音符（ー）を許可
+    return len(text) > 0 and not text.translate(_DELETE_HIRAGANA)
 
 
+@lru_cache(maxsize=65536)
 def analyze_hiragana(reading: str) -> PhonemeAnalysis:
     """ひらがなを直接音素解析する（MeCab不要）
 
@@ -357,5 +382,3 @@ def analyze_hiragana(reading: str) -> PhonemeAnalysis:
     """
     katakana = hiragana_to_katakana(reading)
     return analyze(katakana)
-
-
@@ -1,12 +1,53 @@
 import atexit
 import sqlite3
+from array import array
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Self
 
+_FETCH_BATCH_SIZE = 256
 
-@dataclass
+# The in-memory posting lists cover vowel/consonant runs of up to this many phonemes
+_MAX_POSTING_LENGTH = 8
+
+_SELECT_ENTRIES = (
+    "SELECT word, reading, vowels, consonants, mora_count, initial_consonant FROM words"
+)
+
+
+def _prefix_bounds(prefix: str) -> tuple[str, str]:
+    """Return [low, high) bounds covering every string that starts with prefix.
+
+    A range on an indexed column is an index seek, whereas LIKE 'x%' scans the
+    whole table: LIKE is case-insensitive and the indexes use BINARY collation.
+    """
+    if not prefix:
+        return "", "\U0010ffff"
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _prefix_condition(column: str) -> str:
+    return f"{column} >= ? AND {column} < ?"
+
+
+@lru_cache(maxsize=16)
+def _pattern_sql(vowel_condition: str | None, consonant_condition: str | None) -> str:
+    """Build the search_by_pattern query for a given combination of column conditions.
+
+    Only a handful of shapes exist, so the SQL string is cached and the
+    connection's statement cache can reuse the compiled statement.
+    """
+    conditions = [c for c in (vowel_condition, consonant_condition) if c]
+    if not conditions:
+        return f"{_SELECT_ENTRIES} LIMIT ?"
+    return f"{_SELECT_ENTRIES} WHERE {' AND '.join(conditions)} LIMIT ?"
+
+
+# One instance per indexed word; slots drop the per-instance __dict__
+@dataclass(slots=True)
 class IndexEntry:
     word: str
     reading: str
@@ -31,7 +72,12 @@ class RhymeIndex:
         vowels_rev TEXT,
         consonants_rev TEXT
     );
+    """
 
+    # idx_word enforces unique surfaces; it is built with the others after a bulk load, which
+    # dedups surfaces itself, instead of being updated on every insert
+    INDEXES = """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_word ON words(word);
     CREATE INDEX IF NOT EXISTS idx_vowels ON words(vowels);
     CREATE INDEX IF NOT EXISTS idx_consonants ON words(consonants);
     CREATE INDEX IF NOT EXISTS idx_vowels_rev ON words(vowels_rev);
@@ -40,15 +86,52 @@ class RhymeIndex:
     CREATE INDEX IF NOT EXISTS idx_mora ON words(mora_count);
     """
 
+    # The index is a regenerable build artifact, so durability is traded for load speed
+    BULK_LOAD_PRAGMAS = """
+    PRAGMA journal_mode = OFF;
+    PRAGMA synchronous = OFF;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -200000;
+    PRAGMA locking_mode = EXCLUSIVE;
+    """
+
+    # Query-time connections never write; memory-mapping the file serves page reads from the
+    # OS page cache without a read() syscall per page
+    READ_ONLY_PRAGMAS = """
+    PRAGMA query_only = ON;
+    PRAGMA mmap_size = 268435456;
+    """
+
+    # Fixed query shapes; sqlite3 reuses the prepared statement for an identical SQL string
+    # Prefix searches (and vowel suffix searches, via the reversed column) are index range
+    # scans; vowels are single letters, so a reversed-string prefix is exactly a suffix
+    _SQL_VOWELS_PREFIX = f"{_SELECT_ENTRIES} WHERE {_prefix_condition('vowels')} LIMIT ?"
+    _SQL_VOWELS_REV_PREFIX = f"{_SELECT_ENTRIES} WHERE {_prefix_condition('vowels_rev')} LIMIT ?"
+    _SQL_CONSONANTS_PREFIX = f"{_SELECT_ENTRIES} WHERE {_prefix_condition('consonants')} LIMIT ?"
+    _SQL_CONSONANTS_LIKE = f"{_SELECT_ENTRIES} WHERE consonants LIKE ? LIMIT ?"
+    _SQL_PERFECT = f"{_SELECT_ENTRIES} WHERE vowels = ? AND mora_count = ?"
+    _SQL_ALL = _SELECT_ENTRIES
+    # Surfaces are unique (idx_word); the first entry wins, so callers insert in source
+    # priority order
+    _SQL_INSERT = """
+    INSERT OR IGNORE INTO words (
+        word, reading, vowels, consonants,
+        mora_count, initial_consonant, vowels_rev, consonants_rev
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_path: str | None = None) -> None:
         self._db_path = db_path
         self._conn: sqlite3.Connection | None = None
+        self._read_only = False
         self._entries: list[IndexEntry] = []
-        self._vowel_index: dict[str, list[int]] = {}
-        self._consonant_index: dict[str, list[int]] = {}
-        self._vowel_prefix_index: dict[str, list[int]] = {}
-        self._consonant_prefix_index: dict[str, list[int]] = {}
-        self._perfect_index: dict[str, list[int]] = {}
+        # Posting lists are packed int32 arrays (4 bytes per id instead of a PyObject each)
+        self._vowel_index: dict[str, array[int]] = {}
+        self._consonant_index: dict[str, array[int]] = {}
+        self._vowel_prefix_index: dict[str, array[int]] = {}
+        self._consonant_prefix_index: dict[str, array[int]] = {}
+        self._perfect_index: dict[str, array[int]] = {}
 
     def __enter__(self) -> Self:
         return self
@@ -63,12 +146,32 @@ class RhymeIndex:
             else:
                 self._conn = sqlite3.connect(self._db_path)
             self._conn.row_factory = sqlite3.Row
+            if self._read_only:
+                self._conn.executescript(self.READ_ONLY_PRAGMAS)
         return self._conn
 
-    def init_db(self) -> None:
-        """Initialize database schema."""
+    def init_db(self, with_indexes: bool = True) -> None:
+        """Initialize database schema.
+
+        Bulk loaders pass with_indexes=False and call create_indexes() once all
+        rows are inserted, so each index is built in one pass instead of being
+        updated on every insert.
+        """
         conn = self._get_conn()
         conn.executescript(self.SCHEMA)
+        if with_indexes:
+            conn.executescript(self.INDEXES)
+        conn.commit()
+
+    def enable_bulk_load(self) -> None:
+        """Configure the connection for a one-shot bulk build (no journal, no fsync)."""
+        conn = self._get_conn()
+        conn.executescript(self.BULK_LOAD_PRAGMAS)
+
+    def create_indexes(self) -> None:
+        """Create secondary indexes (after a bulk load)."""
+        conn = self._get_conn()
+        conn.executescript(self.INDEXES)
         conn.commit()
 
     def add_entry(self, entry: IndexEntry) -> None:
@@ -77,60 +180,55 @@ class RhymeIndex:
         self._entries.append(entry)
 
         vowels = entry.vowels.split("-")
-        for length in range(1, min(9, len(vowels) + 1)):
-            key = "-".join(vowels[-length:])
-            if key not in self._vowel_index:
-                self._vowel_index[key] = []
-            self._vowel_index[key].append(idx)
-
-        for length in range(1, min(9, len(vowels) + 1)):
-            key = "-".join(vowels[:length])
-            if key not in self._vowel_prefix_index:
-                self._vowel_prefix_index[key] = []
-            self._vowel_prefix_index[key].append(idx)
+        for length in range(1, min(_MAX_POSTING_LENGTH, len(vowels)) + 1):
+            self._add_posting(self._vowel_index, "-".join(vowels[-length:]), idx)
+
+        for length in range(1, min(_MAX_POSTING_LENGTH, len(vowels)) + 1):
+            self._add_posting(self._vowel_prefix_index, "-".join(vowels[:length]), idx)
 
         consonants = entry.consonants.split("-")
-        for length in range(1, min(9, len(consonants) + 1)):
-            key = "-".join(consonants[-length:])
-            if key not in self._consonant_index:
-                self._consonant_index[key] = []
-            self._consonant_index[key].append(idx)
-
-        for length in range(1, min(9, len(consonants) + 1)):
-            key = "-".join(consonants[:length])
-            if key not in self._consonant_prefix_index:
-                self._consonant_prefix_index[key] = []
-            self._consonant_prefix_index[key].append(idx)
+        for length in range(1, min(_MAX_POSTING_LENGTH, len(consonants)) + 1):
+            self._add_posting(self._consonant_index, "-".join(consonants[-length:]), idx)
+
+        for length in range(1, min(_MAX_POSTING_LENGTH, len(consonants)) + 1):
+            self._add_posting(self._consonant_prefix_index, "-".join(consonants[:length]), idx)
 
         perfect_key = f"{entry.vowels}:{entry.mora_count}"
-        if perfect_key not in self._perfect_index:
-            self._perfect_index[perfect_key] = []
-        self._perfect_index[perfect_key].append(idx)
+        self._add_posting(self._perfect_index, perfect_key, idx)
+
+    @staticmethod
+    def _add_posting(postings: dict[str, array[int]], key: str, idx: int) -> None:
+        posting = postings.get(key)
+        if posting is None:
+            posting = postings[key] = array("i")
+        posting.append(idx)
 
     def add_entry_to_db(self, entry: IndexEntry) -> None:
         """Add entry directly to SQLite database."""
         conn = self._get_conn()
+        conn.execute(self._SQL_INSERT, self._entry_to_row(entry))
+
+    def add_entries_bulk(self, entries: Iterable[IndexEntry]) -> int:
+        """Add many entries to SQLite database with a single executemany call.
+
+        Returns:
+            Number of rows inserted (entries whose word already exists are skipped)
+        """
+        conn = self._get_conn()
+        return conn.executemany(self._SQL_INSERT, map(self._entry_to_row, entries)).rowcount
+
+    @classmethod
+    def _entry_to_row(cls, entry: IndexEntry) -> tuple[str | int, ...]:
         # Create reversed patterns for suffix search optimization
-        vowels_rev = self._reverse_pattern(entry.vowels)
-        consonants_rev = self._reverse_pattern(entry.consonants)
-        conn.execute(
-            """
-            INSERT INTO words (
-                word, reading, vowels, consonants,
-                mora_count, initial_consonant, vowels_rev, consonants_rev
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                entry.word,
-                entry.reading,
-                entry.vowels,
-                entry.consonants,
-                entry.mora_count,
-                entry.initial_consonant,
-                vowels_rev,
-                consonants_rev,
-            ),
+        return (
+            entry.word,
+            entry.reading,
+            entry.vowels,
+            entry.consonants,
+            entry.mora_count,
+            entry.initial_consonant,
+            cls._reverse_pattern(entry.vowels),
+            cls._reverse_pattern(entry.consonants),
         )
 
     @staticmethod
@@ -147,92 +245,55 @@ class RhymeIndex:
     def search_by_vowels(self, pattern: str, limit: int = 100) -> list[IndexEntry]:
         """Search by vowel pattern suffix match."""
         if self._entries:
-            indices = self._vowel_index.get(pattern, [])
+            indices = self._vowel_index.get(pattern, ())
             return [self._entries[i] for i in indices[:limit]]
 
         conn = self._get_conn()
         cursor = conn.execute(
-            """
-            SELECT word, reading, vowels, consonants, mora_count, initial_consonant
-            FROM words
-            WHERE vowels LIKE ?
-            LIMIT ?
-            """,
-            (f"%{pattern}", limit),
+            self._SQL_VOWELS_REV_PREFIX, (*_prefix_bounds(self._reverse_pattern(pattern)), limit)
         )
-        return [self._row_to_entry(row) for row in cursor]
+        return list(self._iter_rows(cursor))
 
     def search_by_vowels_prefix(self, pattern: str, limit: int = 100) -> list[IndexEntry]:
         """Search by vowel pattern prefix match."""
         if self._entries:
-            indices = self._vowel_prefix_index.get(pattern, [])
+            indices = self._vowel_prefix_index.get(pattern, ())
             return [self._entries[i] for i in indices[:limit]]
 
         conn = self._get_conn()
-        cursor = conn.execute(
-            """
-            SELECT word, reading, vowels, consonants, mora_count, initial_consonant
-            FROM words
-            WHERE vowels LIKE ?
-            LIMIT ?
-            """,
-            (f"{pattern}%", limit),
-        )
-        return [self._row_to_entry(row) for row in cursor]
+        cursor = conn.execute(self._SQL_VOWELS_PREFIX, (*_prefix_bounds(pattern), limit))
+        return list(self._iter_rows(cursor))
 
     def search_by_consonants(self, pattern: str, limit: int = 100) -> list[IndexEntry]:
         """Search by consonant pattern suffix match."""
         if self._entries:
-            indices = self._consonant_index.get(pattern, [])
+            indices = self._consonant_index.get(pattern, ())
             return [self._entries[i] for i in indices[:limit]]
 
         conn = self._get_conn()
-        cursor = conn.execute(
-            """
-            SELECT word, reading, vowels, consonants, mora_count, initial_consonant
-            FROM words
-            WHERE consonants LIKE ?
-            LIMIT ?
-            """,
-            (f"%{pattern}", limit),
-        )
-        return [self._row_to_entry(row) for row in cursor]
+        cursor = conn.execute(self._SQL_CONSONANTS_LIKE, (f"%{pattern}", limit))
+        return list(self._iter_rows(cursor))
 
     def search_by_consonants_prefix(self, pattern: str, limit: int = 100) -> list[IndexEntry]:
         """Search by consonant pattern prefix match."""
         if self._entries:
-            indices = self._consonant_prefix_index.get(pattern, [])
+            indices = self._consonant_prefix_index.get(pattern, ())
             return [self._entries[i] for i in indices[:limit]]
 
         conn = self._get_conn()
-        cursor = conn.execute(
-            """
-            SELECT word, reading, vowels, consonants, mora_count, initial_consonant
-            FROM words
-            WHERE consonants LIKE ?
-            LIMIT ?
-            """,
-            (f"{pattern}%", limit),
-        )
-        return [self._row_to_entry(row) for row in cursor]
+        cursor = conn.execute(self._SQL_CONSONANTS_PREFIX, (*_prefix_bounds(pattern), limit))
+        return list(self._iter_rows(cursor))
 
     def search_perfect(self, vowels: str, mora_count: int) -> list[IndexEntry]:
         """Search for perfect rhyme (same vowels and mora count)."""
         if self._entries:
             key = f"{vowels}:{mora_count}"
-            indices = self._perfect_index.get(key, [])
+            indices = self._perfect_index.get(key, ())
             return [self._entries[i] for i in indices]
 
         conn = self._get_conn()
-        cursor = conn.execute(
-            """
-            SELECT word, reading, vowels, consonants, mora_count, initial_consonant
-            FROM words
-            WHERE vowels = ? AND mora_count = ?
-            """,
-            (vowels, mora_count),
-        )
-        return [self._row_to_entry(row) for row in cursor]
+        cursor = conn.execute(self._SQL_PERFECT, (vowels, mora_count))
+        return list(self._iter_rows(cursor))
 
     def get_all_entries(self) -> list[IndexEntry]:
         """Get all entries (for compatibility)."""
@@ -240,13 +301,8 @@ class RhymeIndex:
             return self._entries
 
         conn = self._get_conn()
-        cursor = conn.execute(
-            """
-            SELECT word, reading, vowels, consonants, mora_count, initial_consonant
-            FROM words
-            """
-        )
-        return [self._row_to_entry(row) for row in cursor]
+        cursor = conn.execute(self._SQL_ALL)
+        return list(self._iter_rows(cursor))
 
     def search_by_pattern(
         self,
@@ -268,63 +324,111 @@ class RhymeIndex:
         Returns:
             List of matching entries
         """
+        return list(
+            self.iter_search_by_pattern(vowel_pattern, consonant_pattern, prefix, suffix, limit)
+        )
+
+    def iter_search_by_pattern(
+        self,
+        vowel_pattern: str | None = None,
+        consonant_pattern: str | None = None,
+        prefix: bool = False,
+        suffix: bool = False,
+        limit: int = 10000,
+    ) -> Iterator[IndexEntry]:
+        """Lazily yield entries matching a pattern (see search_by_pattern).
+
+        Rows are converted to IndexEntry one at a time, so callers that filter
+        candidates do not hold the whole candidate set in memory. This matters
+        most when no pattern is given and up to `limit` arbitrary rows match.
+        """
         if self._entries:
             # In-memory fallback for tests
-            return self._entries[:limit]
+            ids = self._posting_candidates(vowel_pattern, consonant_pattern, prefix, suffix)
+            if ids is None:
+                yield from islice(self._entries, limit)
+            else:
+                entries = self._entries
+                for idx in islice(ids, limit):
+                    yield entries[idx]
+            return
 
         conn = self._get_conn()
-        conditions = []
+        vowel_condition = None
+        consonant_condition = None
         params: list[str | int] = []
 
         if vowel_pattern:
             if suffix:
                 # Use reversed column for suffix match (becomes prefix search)
-                vowel_pattern_rev = self._reverse_pattern(vowel_pattern)
-                conditions.append("vowels_rev LIKE ?")
-                params.append(f"{vowel_pattern_rev}%")
+                vowel_condition = _prefix_condition("vowels_rev")
+                params.extend(_prefix_bounds(self._reverse_pattern(vowel_pattern)))
             elif prefix:
-                conditions.append("vowels LIKE ?")
-                params.append(f"{vowel_pattern}%")
+                vowel_condition = _prefix_condition("vowels")
+                params.extend(_prefix_bounds(vowel_pattern))
             else:
                 # Contains - use LIKE with wildcards (slower but necessary)
-                conditions.append("vowels LIKE ?")
+                vowel_condition = "vowels LIKE ?"
                 params.append(f"%{vowel_pattern}%")
 
         if consonant_pattern:
             if suffix:
-                consonant_pattern_rev = self._reverse_pattern(consonant_pattern)
-                conditions.append("consonants_rev LIKE ?")
-                params.append(f"{consonant_pattern_rev}%")
+                consonant_condition = _prefix_condition("consonants_rev")
+                params.extend(_prefix_bounds(self._reverse_pattern(consonant_pattern)))
             elif prefix:
-                conditions.append("consonants LIKE ?")
-                params.append(f"{consonant_pattern}%")
+                consonant_condition = _prefix_condition("consonants")
+                params.extend(_prefix_bounds(consonant_pattern))
             else:
-                conditions.append("consonants LIKE ?")
+                consonant_condition = "consonants LIKE ?"
                 params.append(f"%{consonant_pattern}%")
 
-        if not conditions:
-            # No pattern specified, return limited results
-            cursor = conn.execute(
-                """
-                SELECT word, reading, vowels, consonants, mora_count, initial_consonant
-                FROM words LIMIT ?
-                """,
-                (limit,),
-            )
-        else:
-            where_clause = " AND ".join(conditions)
-            params.append(limit)
-            cursor = conn.execute(
-                f"""
-                SELECT word, reading, vowels, consonants, mora_count, initial_consonant
-                FROM words
-                WHERE {where_clause}
-                LIMIT ?
-                """,
-                params,
-            )
+        params.append(limit)
+        cursor = conn.execute(_pattern_sql(vowel_condition, consonant_condition), params)
+
+        yield from self._iter_rows(cursor)
 
-        return [self._row_to_entry(row) for row in cursor]
+    def _posting_candidates(
+        self,
+        vowel_pattern: str | None,
+        consonant_pattern: str | None,
+        prefix: bool,
+        suffix: bool,
+    ) -> Iterable[int] | None:
+        """Entry ids for an anchored pattern from the posting lists.
+
+        Returns None when the posting lists cannot answer the query (contains
+        patterns, no pattern at all, or runs longer than _MAX_POSTING_LENGTH),
+        in which case the caller scans every entry.
+        """
+        if suffix:
+            tables = (self._vowel_index, self._consonant_index)
+        elif prefix:
+            tables = (self._vowel_prefix_index, self._consonant_prefix_index)
+        else:
+            return None
+
+        postings: list[array[int]] = []
+        for table, pattern in zip(tables, (vowel_pattern, consonant_pattern), strict=True):
+            if not pattern:
+                continue
+            if pattern.count("-") >= _MAX_POSTING_LENGTH:
+                return None
+            postings.append(table.get(pattern, array("i")))
+
+        if not postings:
+            return None
+        if len(postings) == 1:
+            return postings[0]
+        # Ids are appended in entry order, so filtering one list keeps the scan order
+        vowel_ids, consonant_ids = postings
+        consonant_set = set(consonant_ids)
+        return [idx for idx in vowel_ids if idx in consonant_set]
+
+    def _iter_rows(self, cursor: sqlite3.Cursor) -> Iterator[IndexEntry]:
+        """Convert rows to entries lazily, fetching from SQLite in batches."""
+        while rows := cursor.fetchmany(_FETCH_BATCH_SIZE):
+            for row in rows:
+                yield self._row_to_entry(row)
 
     def _row_to_entry(self, row: sqlite3.Row) -> IndexEntry:
         return IndexEntry(
@@ -337,9 +441,10 @@ class RhymeIndex:
         )
 
     def load_from_db(self, db_path: str) -> None:
-        """Load index from SQLite database."""
+        """Load index from SQLite database for read-only querying."""
         self._db_path = db_path
         self._conn = None
+        self._read_only = True
         self._entries = []
 
     def close(self) -> None:
@@ -364,7 +469,12 @@ class RhymeIndex:
                     "initial_consonant": e.initial_consonant,
                 }
                 for e in self._entries
-            ]
+            ],
+            # Persist the computed postings so load() does not rebuild them entry by entry
+            "postings": {
+                name: {key: ids.tolist() for key, ids in table.items()}
+                for name, table in self._posting_tables().items()
+            },
         }
         os.makedirs(os.path.dirname(path), exist_ok=True)
         with open(path, "w", encoding="utf-8") as f:
@@ -384,8 +494,8 @@ class RhymeIndex:
         self._consonant_prefix_index = {}
         self._perfect_index = {}
 
-        for item in data["entries"]:
-            entry = IndexEntry(
+        entries = [
+            IndexEntry(
                 word=item["word"],
                 reading=item["reading"],
                 vowels=item["vowels"],
@@ -393,7 +503,28 @@ class RhymeIndex:
                 mora_count=item.get("mora_count", 0),
                 initial_consonant=item.get("initial_consonant", ""),
             )
-            self.add_entry(entry)
+            for item in data["entries"]
+        ]
+
+        postings = data.get("postings")
+        if postings is None:
+            # Older files without postings: rebuild them
+            for entry in entries:
+                self.add_entry(entry)
+            return
+
+        self._entries = entries
+        for name, table in self._posting_tables().items():
+            table.update((key, array("i", ids)) for key, ids in postings[name].items())
+
+    def _posting_tables(self) -> dict[str, dict[str, array[int]]]:
+        return {
+            "vowel": self._vowel_index,
+            "vowel_prefix": self._vowel_prefix_index,
+            "consonant": self._consonant_index,
+            "consonant_prefix": self._consonant_prefix_index,
+            "perfect": self._perfect_index,
+        }
 
 
 @lru_cache(maxsize=1)
@@ -1,5 +1,8 @@
 """Utility functions for rhyme search routing."""
 
+import re
+from functools import lru_cache
+
 from app.models.schemas import PatternAnalyzeResponse, Phoneme
 from app.services.phoneme import (
     analyze_hiragana,
@@ -8,26 +11,39 @@ from app.services.phoneme import (
     katakana_to_hiragana,
 )
 
+_KANJI_RE = re.compile(r"[\u4e00-\u9fff]")
+_HIRAGANA_RE = re.compile(r"[\u3040-\u309f]")
+_KATAKANA_RE = re.compile(r"[\u30a0-\u30ff]")
+_NOISE_SYMBOLS = (
+    "()（）「」『』【】・#＃&＆@＠!！?？*＊%％^＾~〜_＿+=<>《》-－―─—.．:：;；,'\"'、。○●☆★♪♯♭"
+)
+_NOISE_SYMBOL_RE = re.compile(f"[{re.escape(_NOISE_SYMBOLS)}]")
+# Regex class body matching exactly the str.isdigit() characters: decimal digits plus
+# super/subscript, circled and other numeric digits (the last four ranges are outside the
+# BMP: Kharoshthi, Rumi, Brahmi and digit-comma/full-stop). Shared with scripts/build_index.py.
+DIGIT_CHARS = (
+    r"\d²³¹፩-፱᧚⁰⁴-⁹₀-₉①-⑨⑴-⑼⒈-⒐⓪⓵-⓽⓿❶-❾➀-➈➊-➒"
+    r"\U00010A40-\U00010A43\U00010E60-\U00010E68\U00011052-\U0001105A\U0001F100-\U0001F10A"
+)
+_DIGIT_RE = re.compile(f"[{DIGIT_CHARS}]")
+_ASCII_ALPHA_RE = re.compile(r"[A-Za-z]")
+
 
+@lru_cache(maxsize=4096)
 def word_priority(word: str) -> tuple[int, int]:
     """Calculate word priority for sorting (kanji preferred, shorter preferred)."""
-    has_kanji = any("\u4e00" <= c <= "\u9fff" for c in word)
-    has_hiragana = any("\u3040" <= c <= "\u309f" for c in word)
-    has_katakana = any("\u30a0" <= c <= "\u30ff" for c in word)
-    noise_symbols = (
-        "()（）「」『』【】・#＃&＆@＠!！?？*＊%％^＾~〜_＿+=<>《》-－―─—.．:：;；,'\"'、。○●☆★♪♯♭"
-    )
-    has_symbol = any(c in noise_symbols for c in word)
-    has_digit = any(c.isdigit() for c in word)
-    has_alpha = any(c.isascii() and c.isalpha() for c in word)
-
     length_penalty = -len(word)
 
-    if has_symbol:
+    # Noise checks decide the priority on their own, so they run (and return) first
+    if _NOISE_SYMBOL_RE.search(word) is not None:
         return (-2, length_penalty)
-    if has_digit or has_alpha:
+    if _DIGIT_RE.search(word) is not None or _ASCII_ALPHA_RE.search(word) is not None:
         return (-1, length_penalty)
 
+    has_kanji = _KANJI_RE.search(word) is not None
+    has_hiragana = _HIRAGANA_RE.search(word) is not None
+    has_katakana = _KATAKANA_RE.search(word) is not None
+
     if has_kanji and not has_hiragana and not has_katakana:
         type_priority = 5
     elif has_kanji and has_hiragana and not has_katakana:
@@ -48,65 +64,87 @@ def word_priority(word: str) -> tuple[int, int]:
     return (type_priority, length_penalty)
 
 
+# Consonant-only phonemes (ん, っ) carry no vowel in the stored vowel pattern
+_VOWELLESS_CONSONANTS = frozenset(("N", "Q"))
+
+
 def extract_patterns(parsed) -> tuple[str | None, str | None, bool, bool]:
     """Extract vowel and consonant patterns from parsed pattern for SQL pre-filtering.
 
+    The vowel and consonant runs are collected independently, each stopping at
+    its own first wildcard. Suffix patterns (*pattern) are anchored at the end,
+    so their runs are collected from the last phoneme backwards.
+
     Returns:
         Tuple of (vowel_pattern, consonant_pattern, is_prefix, is_suffix)
     """
-    if not parsed.phoneme_patterns:
+    phoneme_patterns = parsed.phoneme_patterns
+    if not phoneme_patterns:
         return None, None, False, False
 
-    vowels = []
-    consonants = []
-    has_vowel_wildcard = False
-    has_consonant_wildcard = False
-
-    for p in parsed.phoneme_patterns:
-        if p.vowel is not None:
-            if has_vowel_wildcard:
-                break
-            vowels.append(p.vowel)
-        else:
-            has_vowel_wildcard = True
-            if vowels:
-                break
-
-        # Skip empty consonants as DB stores only non-empty consonants
-        if p.consonant is not None and not has_vowel_wildcard:
-            if p.consonant:
-                consonants.append(p.consonant)
-        else:
-            has_consonant_wildcard = True
-
     is_suffix = parsed.prefix_wildcard and not parsed.suffix_wildcard  # *pattern
     is_prefix = not parsed.prefix_wildcard and parsed.suffix_wildcard  # pattern*
 
+    vowels: list[str] = []
+    consonants: list[str] = []
+    collect_vowels = True
+    collect_consonants = True
+
+    for p in reversed(phoneme_patterns) if is_suffix else phoneme_patterns:
+        if collect_vowels:
+            if p.vowel is not None:
+                vowels.append(p.vowel)
+            elif p.consonant not in _VOWELLESS_CONSONANTS:
+                collect_vowels = False
+
+        if collect_consonants:
+            if p.consonant is None:
+                collect_consonants = False
+            elif p.consonant:
+                # Skip empty consonants as DB stores only non-empty consonants
+                consonants.append(p.consonant)
+
+        if not collect_vowels and not collect_consonants:
+            break
+
+    if is_suffix:
+        vowels.reverse()
+        consonants.reverse()
+
     vowel_pattern = "-".join(vowels) if vowels else None
-    consonant_pattern = "-".join(consonants) if consonants and not has_consonant_wildcard else None
+    consonant_pattern = "-".join(consonants) if consonants else None
 
     return vowel_pattern, consonant_pattern, is_prefix, is_suffix
 
 
-def analyze_reading(reading: str) -> PatternAnalyzeResponse:
-    """Analyze hiragana reading and return phoneme info."""
+@lru_cache(maxsize=4096)
+def _analyze_reading_cached(reading: str) -> tuple[tuple[tuple[str, str, str], ...], str, str]:
+    """Analyze a reading into ((consonant, vowel, display), ...), vowels, consonants.
+
+    Response models are mutable, so only plain tuples are cached and shared.
+    """
     katakana = hiragana_to_katakana(reading)
     phonemes_raw = extract_phonemes(katakana)
     analysis = analyze_hiragana(reading)
 
-    phonemes = [
-        Phoneme(
-            consonant=p.consonant,
-            vowel=p.vowel or "",
-            display=katakana_to_hiragana(p.display),
-        )
+    phonemes = tuple(
+        (p.consonant, p.vowel or "", katakana_to_hiragana(p.display))
         for p in phonemes_raw
         if p.vowel is not None or p.consonant == "Q"
-    ]
+    )
+    return phonemes, analysis.vowels, analysis.consonants
+
+
+def analyze_reading(reading: str) -> PatternAnalyzeResponse:
+    """Analyze hiragana reading and return phoneme info."""
+    phonemes, vowel_pattern, consonant_pattern = _analyze_reading_cached(reading)
 
     return PatternAnalyzeResponse(
         reading=reading,
-        phonemes=phonemes,
-        vowel_pattern=analysis.vowels,
-        consonant_pattern=analysis.consonants,
+        phonemes=[
+            Phoneme(consonant=consonant, vowel=vowel, display=display)
+            for consonant, vowel, display in phonemes
+        ],
+        vowel_pattern=vowel_pattern,
+        consonant_pattern=consonant_pattern,
     )
@@ -1,12 +1,21 @@
 """Similarity scoring between input and result rhyme patterns."""
 
+from collections.abc import Sequence
+from functools import lru_cache
+
 # Scoring weights
 _VOWEL_WEIGHT = 0.60
 _CONSONANT_WEIGHT = 0.25
 _MORA_WEIGHT = 0.15
 
 
-def _weighted_sequence_match(a: list[str], b: list[str]) -> float:
+@lru_cache(maxsize=4096)
+def _tokens(pattern: str) -> tuple[str, ...]:
+    """Split a hyphen-separated pattern once; the input pattern repeats on every result row."""
+    return tuple(pattern.split("-")) if pattern else ()
+
+
+def _weighted_sequence_match(a: Sequence[str], b: Sequence[str]) -> float:
     """Compare two sequences from the end with increasing weight toward the suffix.
 
     Rhymes depend heavily on the ending, so later elements get higher weight.
@@ -14,28 +23,29 @@ def _weighted_sequence_match(a: list[str], b: list[str]) -> float:
     """
     if not a or not b:
         return 1.0 if (not a and not b) else 0.0
+    # Empty tokens never match, so identical sequences only score 1.0 without them
+    if a == b and "" not in a:
+        return 1.0
+
+    len_a = len(a)
+    len_b = len(b)
+    max_len = max(len_a, len_b)
+    # Align endings without padding: position i maps to a[i - offset_a] when in range.
+    # Weight increases linearly toward the end: position 0 gets weight 1, last gets max_len
+    offset_a = max_len - len_a
+    offset_b = max_len - len_b
+    total_weight = max_len * (max_len + 1) // 2
+
+    matched_weight = 0
+    for i in range(max(offset_a, offset_b), max_len):
+        x = a[i - offset_a]
+        if x and x == b[i - offset_b]:
+            matched_weight += i + 1
 
-    max_len = max(len(a), len(b))
-    # Pad shorter sequence from the front so endings align
-    padded_a = [""] * (max_len - len(a)) + a
-    padded_b = [""] * (max_len - len(b)) + b
-
-    total_weight = 0.0
-    matched_weight = 0.0
-
-    for i in range(max_len):
-        # Weight increases linearly toward the end: position 0 gets weight 1, last gets max_len
-        weight = i + 1
-        total_weight += weight
-        if padded_a[i] == padded_b[i] and padded_a[i] != "":
-            matched_weight += weight
-
-    if total_weight == 0.0:
-        return 0.0
     return matched_weight / total_weight
 
 
-def _sequence_match(a: list[str], b: list[str]) -> float:
+def _sequence_match(a: Sequence[str], b: Sequence[str]) -> float:
     """Simple ratio of matching elements (position-wise, end-aligned).
 
     Returns a score between 0.0 and 1.0.
@@ -43,12 +53,18 @@ def _sequence_match(a: list[str], b: list[str]) -> float:
     if not a or not b:
         return 1.0 if (not a and not b) else 0.0
 
-    max_len = max(len(a), len(b))
-    padded_a = [""] * (max_len - len(a)) + a
-    padded_b = [""] * (max_len - len(b)) + b
+    if a == b and "" not in a:
+        return 1.0
 
-    matches = sum(1 for x, y in zip(padded_a, padded_b, strict=True) if x == y and x != "")
-    return matches / max_len
+    len_a = len(a)
+    len_b = len(b)
+    # Compare the end-aligned overlap only; padded positions never match
+    matches = 0
+    for i in range(1, min(len_a, len_b) + 1):
+        x = a[len_a - i]
+        if x and x == b[len_b - i]:
+            matches += 1
+    return matches / max(len_a, len_b)
 
 
 def calculate_similarity(
@@ -68,14 +84,8 @@ def calculate_similarity(
 
     Returns: float between 0.0 and 1.0
     """
-    v_a = input_vowels.split("-") if input_vowels else []
-    v_b = result_vowels.split("-") if result_vowels else []
-
-    c_a = input_consonants.split("-") if input_consonants else []
-    c_b = result_consonants.split("-") if result_consonants else []
-
-    vowel_score = _weighted_sequence_match(v_a, v_b)
-    consonant_score = _sequence_match(c_a, c_b)
+    vowel_score = _weighted_sequence_match(_tokens(input_vowels), _tokens(result_vowels))
+    consonant_score = _sequence_match(_tokens(input_consonants), _tokens(result_consonants))
 
     if input_mora == 0 and result_mora == 0:
         mora_score = 1.0
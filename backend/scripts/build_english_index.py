@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 """Build English rhyme index from CMU Pronouncing Dictionary."""
 
+import json
+import mmap
+import re
 import sqlite3
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -11,62 +17,153 @@ from app.services.english_phoneme import analyze_english, arpabet_to_katakana
 
 CMU_DICT_PATH = Path(__file__).parent.parent / "data" / "cmudict.txt"
 DEFAULT_OUTPUT = "data/english_rhyme_index.db"
+ANALYSIS_CHUNK_SIZE = 2000
+MAX_ERROR_SAMPLES = 10
+
+# Format: word  pronunciation, one entry per line. The word class excludes "(" and ";",
+# so variant entries and ";;;" comments never match; a leading apostrophe is a contraction.
+_CMU_LINE_RE = re.compile(
+    rb"^[ \t\f\v\r]*(?!')([A-Za-z'-]{2,})[ \t\f\v\r]+(\S[^\n]*?)[ \t\f\v\r]*$", re.MULTILINE
+)
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE english_words (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        word TEXT NOT NULL,
+        pronunciation TEXT NOT NULL,
+        katakana TEXT NOT NULL,
+        vowels TEXT NOT NULL,
+        consonants TEXT NOT NULL,
+        syllable_count INTEGER NOT NULL
+    )
+"""
+
+INSERT_SQL = """
+    INSERT INTO english_words
+    (word, pronunciation, katakana, vowels, consonants, syllable_count)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Inserts a whole chunk from one JSON array of row arrays: one bind, and the rows are
+# unpacked inside SQLite instead of crossing the Python/C boundary one tuple at a time
+INSERT_JSON_SQL = """
+    INSERT INTO english_words
+    (word, pronunciation, katakana, vowels, consonants, syllable_count)
+    SELECT
+        json_extract(value, '$[0]'), json_extract(value, '$[1]'), json_extract(value, '$[2]'),
+        json_extract(value, '$[3]'), json_extract(value, '$[4]'), json_extract(value, '$[5]')
+    FROM json_each(?)
+"""
+
+CREATE_INDEXES_SQL = """
+    CREATE INDEX idx_english_vowels ON english_words(vowels);
+    CREATE INDEX idx_english_syllables ON english_words(syllable_count);
+    CREATE INDEX idx_english_word ON english_words(word);
+"""
 
 
 def parse_cmu_dict(dict_path: Path) -> list[tuple[str, str]]:
-    """Parse CMU Pronouncing Dictionary.
+    """Parse CMU Pronouncing Dictionary into indexable entries.
+
+    Comments, variant pronunciations (e.g. "read(2)"), leading-apostrophe
+    contractions, single characters and words with digits or special characters
+    are rejected by ``_CMU_LINE_RE`` in the same pass.
 
     Args:
         dict_path: Path to cmudict.txt
 
     Returns:
-        List of (word, pronunciation) tuples
+        List of (lowercased word, pronunciation) tuples
     """
-    entries: list[tuple[str, str]] = []
+    if dict_path.stat().st_size == 0:
+        return []
+
+    # Scan the mapped file directly so only matching lines are ever materialized and decoded
+    with open(dict_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return [
+            (m.group(1).decode("ascii").lower(), m.group(2).decode("utf-8"))
+            for m in _CMU_LINE_RE.finditer(mm)
+        ]
+
 
-    with open(dict_path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith(";;;"):
-                continue
+@cache
+def _analyze_pronunciation(pronunciation: str) -> tuple[str, str, str, int]:
+    """Analyze a pronunciation once per worker; homophones share the result.
+
+    The analysis only depends on the pronunciation, so the word is not part of the key.
+
+    Returns:
+        Tuple of (katakana, vowels, consonants, syllable_count)
+    """
+    analysis = analyze_english("", pronunciation)
+    katakana = arpabet_to_katakana(pronunciation) if analysis.vowels else ""
+    return katakana, analysis.vowels, analysis.consonants, analysis.syllable_count
 
-            # Format: word  pronunciation
-            # Some words have variants like "word(2)"
-            parts = line.split(maxsplit=1)
-            if len(parts) != 2:
-                continue
 
-            word, pronunciation = parts
+def analyze_chunk(
+    entries: list[tuple[str, str]],
+) -> tuple[list[tuple[str, str, str, str, str, int]], list[str]]:
+    """Analyze (word, pronunciation) pairs into table rows.
 
-            # Skip variant pronunciations for now (e.g., "read(2)")
-            if "(" in word:
-                continue
+    Runs in worker processes, so it returns error messages instead of printing them.
 
-            # Skip words with apostrophes at the start (contractions)
-            if word.startswith("'"):
-                continue
+    Returns:
+        Tuple of (rows, error messages)
+    """
+    rows: list[tuple[str, str, str, str, str, int]] = []
+    errors: list[str] = []
 
-            # Normalize word to lowercase
-            word = word.lower()
+    for word, pronunciation in entries:
+        try:
+            katakana, vowels, consonants, syllable_count = _analyze_pronunciation(pronunciation)
+        except Exception as e:
+            errors.append(f"Error processing {word}: {e}")
+            continue
 
-            entries.append((word, pronunciation))
+        # Skip words with no vowels
+        if not vowels:
+            continue
 
-    return entries
+        rows.append((word, pronunciation, katakana, vowels, consonants, syllable_count))
 
+    return rows, errors
 
-def is_valid_english_word(word: str) -> bool:
-    """Check if word is valid for rhyme index."""
-    # Skip single characters
-    if len(word) < 2:
-        return False
 
-    # Skip words with numbers
-    if any(c.isdigit() for c in word):
-        return False
+def analyze_chunk_to_json(entries: list[tuple[str, str]]) -> tuple[str, list[str]]:
+    """Analyze a chunk in a worker and serialize its rows for INSERT_JSON_SQL.
 
-    # Skip words with special characters (except hyphen and apostrophe)
-    allowed_chars = set("abcdefghijklmnopqrstuvwxyz'-")
-    return all(c in allowed_chars for c in word)
+    Returns:
+        Tuple of (JSON array of rows, error messages)
+    """
+    rows, errors = analyze_chunk(entries)
+    return json.dumps(rows, ensure_ascii=False), errors
+
+
+def _create_database() -> sqlite3.Connection:
+    """Create the in-memory database an index is built in.
+
+    The whole index fits in memory, so it is built there (no journal or page I/O) and
+    written to disk once by _save_database.
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.execute(CREATE_TABLE_SQL)
+    return conn
+
+
+def _save_database(conn: sqlite3.Connection, output: Path) -> None:
+    """Index the loaded table and copy the database to output, replacing any old file."""
+    # Build indexes after the bulk load: one sorted pass each instead of per-row updates
+    conn.executescript(CREATE_INDEXES_SQL)
+    conn.commit()
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if output.exists():
+        output.unlink()
+
+    disk = sqlite3.connect(output)
+    conn.backup(disk)
+    disk.close()
+    conn.close()
 
 
 def build_english_index(
@@ -89,81 +186,41 @@ def build_english_index(
 
     print(f"Parsing CMU dictionary: {dict_path}")
     entries = parse_cmu_dict(dict_path)
-    print(f"Found {len(entries)} entries")
-
-    # Filter valid words
-    valid_entries = [(w, p) for w, p in entries if is_valid_english_word(w)]
-    print(f"Valid entries: {len(valid_entries)}")
+    print(f"Valid entries: {len(entries)}")
 
     output = Path(output_path)
-    output.parent.mkdir(parents=True, exist_ok=True)
-
-    if output.exists():
-        output.unlink()
-
     print(f"Building SQLite index: {output_path}")
 
-    conn = sqlite3.connect(output_path)
+    conn = _create_database()
     cursor = conn.cursor()
 
-    # Create table
-    cursor.execute("""
-        CREATE TABLE english_words (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            word TEXT NOT NULL,
-            pronunciation TEXT NOT NULL,
-            katakana TEXT NOT NULL,
-            vowels TEXT NOT NULL,
-            consonants TEXT NOT NULL,
-            syllable_count INTEGER NOT NULL
-        )
-    """)
-
-    # Create indexes
-    cursor.execute("CREATE INDEX idx_english_vowels ON english_words(vowels)")
-    cursor.execute("CREATE INDEX idx_english_syllables ON english_words(syllable_count)")
-    cursor.execute("CREATE INDEX idx_english_word ON english_words(word)")
+    # Analysis is CPU-bound, so it runs in worker processes; the connection stays in this
+    # process and writes each chunk's rows as they arrive (map preserves input order)
+    chunks = [
+        entries[start : start + ANALYSIS_CHUNK_SIZE]
+        for start in range(0, len(entries), ANALYSIS_CHUNK_SIZE)
+    ]
 
     indexed = 0
     errors = 0
+    error_samples: deque[str] = deque(maxlen=MAX_ERROR_SAMPLES)
 
-    for i, (word, pronunciation) in enumerate(valid_entries):
-        if i % 10000 == 0:
-            print(f"Processing {i}/{len(valid_entries)}...")
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(analyze_chunk_to_json, chunks, chunksize=4)
+        for i, (payload, chunk_errors) in enumerate(results):
+            processed = i * ANALYSIS_CHUNK_SIZE
+            if processed % 10000 == 0:
+                print(f"Processing {processed}/{len(entries)}...")
 
-        try:
-            analysis = analyze_english(word, pronunciation)
-
-            # Skip words with no vowels
-            if not analysis.vowels:
-                continue
-
-            katakana = arpabet_to_katakana(pronunciation)
-
-            cursor.execute(
-                """
-                INSERT INTO english_words
-                (word, pronunciation, katakana, vowels, consonants, syllable_count)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    word,
-                    pronunciation,
-                    katakana,
-                    analysis.vowels,
-                    analysis.consonants,
-                    analysis.syllable_count,
-                ),
-            )
-            indexed += 1
+            cursor.execute(INSERT_JSON_SQL, (payload,))
+            indexed += cursor.rowcount
+            errors += len(chunk_errors)
+            error_samples.extend(chunk_errors)
 
-        except Exception as e:
-            errors += 1
-            if errors < 10:
-                print(f"Error processing {word}: {e}")
+    for message in error_samples:
+        print(message)
 
-    conn.commit()
-    conn.close()
+    _save_database(conn, output)
 
     size_mb = output.stat().st_size / (1024 * 1024)
     print(f"Done! Indexed {indexed} words")
@@ -206,55 +263,12 @@ def build_sample_index(output_path: str = DEFAULT_OUTPUT) -> None:
         ("know", "N OW1"),
     ]
 
-    output = Path(output_path)
-    output.parent.mkdir(parents=True, exist_ok=True)
-
-    if output.exists():
-        output.unlink()
-
     print(f"Building sample SQLite index: {output_path}")
 
-    conn = sqlite3.connect(output_path)
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        CREATE TABLE english_words (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            word TEXT NOT NULL,
-            pronunciation TEXT NOT NULL,
-            katakana TEXT NOT NULL,
-            vowels TEXT NOT NULL,
-            consonants TEXT NOT NULL,
-            syllable_count INTEGER NOT NULL
-        )
-    """)
-
-    cursor.execute("CREATE INDEX idx_english_vowels ON english_words(vowels)")
-    cursor.execute("CREATE INDEX idx_english_syllables ON english_words(syllable_count)")
-    cursor.execute("CREATE INDEX idx_english_word ON english_words(word)")
-
-    for word, pronunciation in sample_entries:
-        analysis = analyze_english(word, pronunciation)
-        katakana = arpabet_to_katakana(pronunciation)
-
-        cursor.execute(
-            """
-            INSERT INTO english_words
-            (word, pronunciation, katakana, vowels, consonants, syllable_count)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                word,
-                pronunciation,
-                katakana,
-                analysis.vowels,
-                analysis.consonants,
-                analysis.syllable_count,
-            ),
-        )
-
-    conn.commit()
-    conn.close()
+    rows, _ = analyze_chunk(sample_entries)
+    conn = _create_database()
+    conn.executemany(INSERT_SQL, rows)
+    _save_database(conn, Path(output_path))
 
     print(f"Done! Indexed {len(sample_entries)} sample words")
 
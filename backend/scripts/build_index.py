@@ -2,17 +2,27 @@
 """Build rhyme index from NEologd seed data."""
 
 import csv
+import json
 import lzma
-import socket
+import mmap
+import os
+import re
+import shutil
+import string
 import sys
+import time
 import urllib.request
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import batched
 from pathlib import Path
-from urllib.error import URLError
+from urllib.error import HTTPError, URLError
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.services.phoneme import analyze
 from app.services.rhyme import IndexEntry, RhymeIndex
+from app.services.search_utils import DIGIT_CHARS
 
 NEOLOGD_SEED_URL = (
     "https://github.com/neologd/mecab-ipadic-neologd/raw/master/seed/"
@@ -39,7 +49,44 @@ IPADIC_FILES = [
 JMDICT_URL = "http://ftp.edrdg.org/pub/Nihongo/JMdict_e.gz"
 
 DOWNLOAD_TIMEOUT = 60  # seconds
+JMDICT_DOWNLOAD_TIMEOUT = 120  # seconds
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_BACKOFF = 0.5  # seconds, doubled on each retry
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+EXTRACT_CHUNK_SIZE = 1 << 20
+READ_BUFFER_SIZE = 1 << 20
+# Columns 0 (surface) and 11 (reading) are all the dictionary CSV parsers need
+CSV_MAX_SPLIT = 12
 MAX_ERRORS = 100
+ANALYSIS_CHUNK_SIZE = 2000
+_SQL_EXISTING_WORDS = "SELECT word FROM words WHERE word IN (SELECT value FROM json_each(?))"
+
+_NOISE_START_CHARS = (
+    "!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"
+    "！＂＃＄％＆＇（）＊＋，－．／：；＜＝＞？＠［＼］＾＿｀｛｜｝～"
+    "、。「」『』【】〔〕・…‥〜ー0123456789０１２３４５６７８９"
+)
+_NOISE_CHARS = (
+    "()（）「」『』【】・#＃&＆@＠!！?？*＊%％^＾~〜_＿+=<>《》\"'、。○●☆★♪♯♭♀♂①②③④⑤⑥⑦⑧⑨⑩"
+)
+# ぁ..ん -> ァ..ン for JMdict readings
+_HIRAGANA_TO_KATAKANA = str.maketrans(
+    {chr(code): chr(code + 0x60) for code in range(ord("ぁ"), ord("ん") + 1)}
+)
+# Hiragana ぁ..ゖ and katakana ァ..ヿ (including the long vowel mark)
+_KANA = frozenset(
+    [chr(code) for code in range(ord("ぁ"), ord("ゖ") + 1)]
+    + [chr(code) for code in range(ord("ァ"), ord("ヿ") + 1)]
+)
+# Checked against the first character only (noise symbols, digits, ASCII letters)
+_NOISE_START = frozenset(_NOISE_START_CHARS + string.ascii_letters)
+# Noise symbols or any digit (see DIGIT_CHARS)
+_NOISE_CHAR_RE = re.compile(f"[{re.escape(_NOISE_CHARS)}{DIGIT_CHARS}]")
+# The first keb/reb in an entry belong to its first k_ele/r_ele
+_JMDICT_ENTRY_RE = re.compile(r"<entry>(.*?)</entry>", re.DOTALL)
+_JMDICT_KEB_RE = re.compile(r"<keb>([^<]*)</keb>")
+_JMDICT_REB_RE = re.compile(r"<reb>([^<]*)</reb>")
 
 
 def is_valid_word(surface: str) -> bool:
@@ -50,101 +97,87 @@ def is_valid_word(surface: str) -> bool:
     if len(surface) > 20:
         return False
 
-    first_char = surface[0]
-    noise_start = (
-        "!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"
-        "！＂＃＄％＆＇（）＊＋，－．／：；＜＝＞？＠［＼］＾＿｀｛｜｝～"
-        "、。「」『』【】〔〕・…‥〜ー0123456789０１２３４５６７８９"
-    )
-    if first_char in noise_start:
-        return False
-    if first_char.isascii() and first_char.isalpha():
+    if surface[0] in _NOISE_START:
         return False
 
-    noise_chars = (
-        "()（）「」『』【】・#＃&＆@＠!！?？*＊%％^＾~〜_＿+=<>《》\"'、。○●☆★♪♯♭♀♂①②③④⑤⑥⑦⑧⑨⑩"
-    )
-    if any(c in noise_chars for c in surface):
+    if surface.isascii():
         return False
 
-    if all(c.isascii() for c in surface):
-        return False
-
-    return not any(c.isdigit() or c in "０１２３４５６７８９" for c in surface)
+    return _NOISE_CHAR_RE.search(surface) is None
 
 
 def download_jmdict(cache_dir: Path) -> Path:
-    """Download JMdict dictionary file."""
-    import gzip
-
+    """Download the gzipped JMdict dictionary file if not cached."""
     cache_dir.mkdir(parents=True, exist_ok=True)
     gz_path = cache_dir / "JMdict_e.gz"
-    xml_path = cache_dir / "JMdict_e.xml"
 
-    if xml_path.exists():
-        print(f"Using cached: {xml_path}")
-        return xml_path
+    if gz_path.exists():
+        print(f"Using cached: {gz_path}")
+        return gz_path
 
-    if not gz_path.exists():
-        print(f"Downloading: {JMDICT_URL}")
-        original_timeout = socket.getdefaulttimeout()
-        try:
-            socket.setdefaulttimeout(120)
-            urllib.request.urlretrieve(JMDICT_URL, gz_path)
-        except (URLError, TimeoutError) as e:
-            raise RuntimeError(f"Download failed: {e}") from e
-        finally:
-            socket.setdefaulttimeout(original_timeout)
+    print(f"Downloading: {JMDICT_URL}")
+    try:
+        _fetch(JMDICT_URL, gz_path, timeout=JMDICT_DOWNLOAD_TIMEOUT)
+    except (URLError, TimeoutError) as e:
+        raise RuntimeError(f"Download failed: {e}") from e
 
-    print(f"Extracting: {gz_path}")
-    with (
-        gzip.open(gz_path, "rt", encoding="utf-8") as f_in,
-        open(xml_path, "w", encoding="utf-8") as f_out,
-    ):
-        f_out.write(f_in.read())
+    return gz_path
 
-    return xml_path
 
+def _iter_jmdict_entries(gz_path: Path) -> Iterator[tuple[str | None, str | None]]:
+    """Yield the first keb and reb of each JMdict entry.
 
-def get_jmdict_words(cache_dir: Path) -> list[tuple[str, str]]:
-    """Get words from JMdict using streaming XML parser."""
-    import xml.etree.ElementTree as ET
+    Scans the decompressed stream for <entry> spans with regexes instead of
+    building an element tree; only keb/reb text is needed.
+    """
+    import gzip
 
-    xml_path = download_jmdict(cache_dir)
-    words: list[tuple[str, str]] = []
+    buffer = ""
+    with gzip.open(gz_path, "rt", encoding="utf-8") as f:
+        while chunk := f.read(READ_BUFFER_SIZE):
+            buffer += chunk
+            # Only scan up to the last complete entry; keep the tail for the next chunk
+            end = buffer.rfind("</entry>")
+            if end < 0:
+                continue
+            end += len("</entry>")
+            for match in _JMDICT_ENTRY_RE.finditer(buffer, 0, end):
+                body = match.group(1)
+                keb = _JMDICT_KEB_RE.search(body)
+                reb = _JMDICT_REB_RE.search(body)
+                yield (
+                    _unescape_xml(keb.group(1)) if keb else None,
+                    _unescape_xml(reb.group(1)) if reb else None,
+                )
+            buffer = buffer[end:]
 
-    print("Parsing JMdict (streaming)...")
 
-    # Use iterparse for memory efficiency
-    context = ET.iterparse(xml_path, events=("end",))
-    count = 0
+def _unescape_xml(text: str) -> str:
+    """Resolve character references in keb/reb text (rare in JMdict)."""
+    if "&" not in text:
+        return text
+    import html
 
-    for _event, elem in context:
-        if elem.tag == "entry":
-            # Extract kanji (keb) and reading (reb)
-            keb_elem = elem.find(".//keb")
-            reb_elem = elem.find(".//reb")
+    return html.unescape(text)
 
-            if keb_elem is not None and reb_elem is not None:
-                surface = keb_elem.text
-                reading = reb_elem.text
 
-                if surface and reading and is_valid_word(surface):
-                    # Convert hiragana reading to katakana
-                    katakana_reading = "".join(
-                        chr(ord(c) + 96) if "ぁ" <= c <= "ん" else c for c in reading
-                    )
-                    words.append((surface, katakana_reading))
+def get_jmdict_words(cache_dir: Path) -> Iterator[tuple[str, str]]:
+    """Yield words from JMdict using a streaming regex scan."""
+    gz_path = download_jmdict(cache_dir)
+    loaded = 0
 
-            # Clear element to save memory
-            elem.clear()
-            count += 1
+    print("Parsing JMdict (streaming)...")
 
-            if count % 50000 == 0:
-                print(f"  Processed {count} entries...")
+    for count, (surface, reading) in enumerate(_iter_jmdict_entries(gz_path), 1):
+        if surface and reading and is_valid_word(surface):
+            # Convert hiragana reading to katakana
+            yield surface, reading.translate(_HIRAGANA_TO_KATAKANA)
+            loaded += 1
 
-    print(f"Loaded {len(words)} words from JMdict")
-    return words
+        if count % 50000 == 0:
+            print(f"  Processed {count} entries...")
+
+    print(f"Loaded {loaded} words from JMdict")
 
 
 # Cached Sudachi tokenizer for efficiency
@@ -182,30 +215,57 @@ def get_reading_from_sudachi(surface: str) -> str | None:
     return None
 
 
+def _fetch(url: str, path: Path, timeout: float = DOWNLOAD_TIMEOUT) -> None:
+    """Stream a URL to disk, only creating the target once the body is complete.
+
+    Connection errors, timeouts and 5xx responses are retried with exponential backoff.
+    """
+    tmp_path = path.with_name(path.name + ".part")
+    for attempt in range(DOWNLOAD_RETRIES + 1):
+        try:
+            with (
+                urllib.request.urlopen(url, timeout=timeout) as resp,
+                open(tmp_path, "wb") as f_out,
+            ):
+                shutil.copyfileobj(resp, f_out, DOWNLOAD_CHUNK_SIZE)
+            tmp_path.replace(path)
+            return
+        except HTTPError as e:
+            if e.code < 500 or attempt == DOWNLOAD_RETRIES:
+                raise
+        except (URLError, TimeoutError):
+            if attempt == DOWNLOAD_RETRIES:
+                raise
+        time.sleep(DOWNLOAD_BACKOFF * 2**attempt)
+
+
 def download_ipadic(cache_dir: Path) -> list[Path]:
-    """Download IPADIC CSV files if not cached."""
+    """Download IPADIC CSV files if not cached.
+
+    Missing files are fetched concurrently; the result keeps IPADIC_FILES order.
+    """
     cache_dir.mkdir(parents=True, exist_ok=True)
-    downloaded = []
+    csv_paths = {filename: cache_dir / f"ipadic_{filename}" for filename in IPADIC_FILES}
+    missing = [filename for filename, csv_path in csv_paths.items() if not csv_path.exists()]
+    failed: set[str] = set()
 
-    for filename in IPADIC_FILES:
-        csv_path = cache_dir / f"ipadic_{filename}"
-        if csv_path.exists():
-            downloaded.append(csv_path)
-            continue
+    if missing:
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = {}
+            for filename in missing:
+                url = IPADIC_BASE_URL + filename
+                print(f"Downloading: {url}")
+                futures[executor.submit(_fetch, url, csv_paths[filename])] = filename
 
-        url = IPADIC_BASE_URL + filename
-        print(f"Downloading: {url}")
-        original_timeout = socket.getdefaulttimeout()
-        try:
-            socket.setdefaulttimeout(DOWNLOAD_TIMEOUT)
-            urllib.request.urlretrieve(url, csv_path)
-            downloaded.append(csv_path)
-        except (URLError, TimeoutError) as e:
-            print(f"Failed to download {filename}: {e}")
-        finally:
-            socket.setdefaulttimeout(original_timeout)
+            for future in as_completed(futures):
+                filename = futures[future]
+                try:
+                    future.result()
+                except (URLError, TimeoutError) as e:
+                    failed.add(filename)
+                    print(f"Failed to download {filename}: {e}")
 
-    return downloaded
+    return [csv_path for filename, csv_path in csv_paths.items() if filename not in failed]
 
 
 def parse_ipadic_csv(csv_path: Path) -> list[tuple[str, str]]:
@@ -218,47 +278,53 @@ def parse_ipadic_csv(csv_path: Path) -> list[tuple[str, str]]:
     words: list[tuple[str, str]] = []
 
     try:
-        with open(csv_path, encoding="euc-jp", errors="replace") as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if len(row) < 12:
-                    continue
+        # Decode the mapped file in one call rather than through a line-by-line text wrapper
+        with open(csv_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, "euc-jp", "replace")
+        for line in text.split("\n"):
+            # Plain lines are split directly; csv is only needed for the rare quoted line
+            row = (
+                next(csv.reader([line]), [])
+                if '"' in line
+                else line.rstrip("\r").split(",", CSV_MAX_SPLIT)
+            )
+            if len(row) < 12:
+                continue
 
-                surface = row[0]
-                reading = row[11] if row[11] != "*" else ""
+            surface = row[0]
+            reading = row[11] if row[11] != "*" else ""
 
-                if not reading:
-                    continue
+            if not reading:
+                continue
 
-                if not is_valid_word(surface):
-                    continue
+            if not is_valid_word(surface):
+                continue
 
-                words.append((surface, reading))
+            words.append((surface, reading))
     except Exception as e:
         print(f"Error parsing {csv_path}: {e}")
 
     return words
 
 
-def get_ipadic_words(cache_dir: Path) -> list[tuple[str, str]]:
-    """Get all words from IPADIC."""
+def get_ipadic_words(cache_dir: Path) -> Iterator[tuple[str, str]]:
+    """Yield all words from IPADIC."""
     csv_files = download_ipadic(cache_dir)
-    all_words: list[tuple[str, str]] = []
+    loaded = 0
 
-    for csv_path in csv_files:
-        words = parse_ipadic_csv(csv_path)
-        all_words.extend(words)
-        print(f"  {csv_path.name}: {len(words)} words")
+    if not csv_files:
+        print("Loaded 0 words from IPADIC")
+        return
 
-    seen: set[str] = set()
-    unique_words: list[tuple[str, str]] = []
-    for surface, reading in all_words:
-        if surface not in seen:
-            seen.add(surface)
-            unique_words.append((surface, reading))
+    # The CSVs are independent and parsing is CPU-bound (EUC-JP decode + validation)
+    with ProcessPoolExecutor(max_workers=min(len(csv_files), os.cpu_count() or 1)) as executor:
+        results = executor.map(parse_ipadic_csv, csv_files)
+        for csv_path, words in zip(csv_files, results, strict=True):
+            yield from words
+            loaded += len(words)
+            print(f"  {csv_path.name}: {len(words)} words")
 
-    print(f"Loaded {len(unique_words)} unique words from IPADIC")
-    return unique_words
+    print(f"Loaded {loaded} words from IPADIC")
 
 
 def download_neologd_seed(cache_dir: Path) -> Path:
@@ -272,38 +338,33 @@ def download_neologd_seed(cache_dir: Path) -> Path:
         return csv_path
 
     print(f"Downloading: {NEOLOGD_SEED_URL}")
-    original_timeout = socket.getdefaulttimeout()
     try:
-        socket.setdefaulttimeout(DOWNLOAD_TIMEOUT)
-        urllib.request.urlretrieve(NEOLOGD_SEED_URL, xz_path)
+        _fetch(NEOLOGD_SEED_URL, xz_path)
     except (URLError, TimeoutError) as e:
         raise RuntimeError(f"Download failed: {e}") from e
-    finally:
-        socket.setdefaulttimeout(original_timeout)
 
     print(f"Extracting: {xz_path}")
-    with (
-        lzma.open(xz_path, "rt", encoding="utf-8") as f_in,
-        open(csv_path, "w", encoding="utf-8") as f_out,
-    ):
-        f_out.write(f_in.read())
+    with lzma.open(xz_path, "rb") as f_in, open(csv_path, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out, EXTRACT_CHUNK_SIZE)
 
     xz_path.unlink()
     return csv_path
 
 
-def parse_neologd_csv(csv_path: Path) -> list[tuple[str, str]]:
-    """Parse NEologd CSV and extract (surface, reading) pairs.
+def parse_neologd_csv(csv_path: Path) -> Iterator[tuple[str, str]]:
+    """Parse NEologd CSV and yield (surface, reading) pairs.
 
     NEologd CSV format (0-indexed):
     - Column 0: Surface form (見出し)
     - Column 11: Reading (読み) in katakana
     """
-    words: list[tuple[str, str]] = []
-
-    with open(csv_path, encoding="utf-8") as f:
-        reader = csv.reader(f)
-        for row in reader:
+    with open(csv_path, encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+        for line in f:
+            row = (
+                next(csv.reader([line]), [])
+                if '"' in line
+                else line.rstrip("\r\n").split(",", CSV_MAX_SPLIT)
+            )
             if len(row) < 12:
                 continue
 
@@ -316,25 +377,17 @@ def parse_neologd_csv(csv_path: Path) -> list[tuple[str, str]]:
             if not is_valid_word(surface):
                 continue
 
-            words.append((surface, reading))
-
-    return words
+            yield surface, reading
 
 
-def get_neologd_words(cache_dir: Path) -> list[tuple[str, str]]:
-    """Get all words from NEologd seed data."""
+def get_neologd_words(cache_dir: Path) -> Iterator[tuple[str, str]]:
+    """Yield all words from NEologd seed data."""
     csv_path = download_neologd_seed(cache_dir)
-    words = parse_neologd_csv(csv_path)
-
-    seen: set[str] = set()
-    unique_words: list[tuple[str, str]] = []
-    for surface, reading in words:
-        if surface not in seen:
-            seen.add(surface)
-            unique_words.append((surface, reading))
-
-    print(f"Loaded {len(unique_words)} unique words from NEologd seed")
-    return unique_words
+    loaded = 0
+    for word in parse_neologd_csv(csv_path):
+        yield word
+        loaded += 1
+    print(f"Loaded {loaded} words from NEologd seed")
 
 
 def select_reading(dict_reading: str, surface: str) -> str:
@@ -344,7 +397,11 @@ def select_reading(dict_reading: str, surface: str) -> str:
     - If dict reading is significantly longer than Sudachi reading,
       use Sudachi (likely a concatenated reading error in dictionary)
     - Otherwise use dict reading (preserves proper nouns like anime titles)
+    - Kana-only surfaces spell their own reading, so Sudachi is not consulted
     """
+    if _KANA.issuperset(surface):
+        return dict_reading
+
     # Empirically determined: dictionary entries with readings >30% longer
     # than Sudachi readings are typically concatenation errors
     _READING_LENGTH_RATIO_THRESHOLD = 1.3
@@ -359,6 +416,61 @@ def select_reading(dict_reading: str, surface: str) -> str:
     return dict_reading
 
 
+def analyze_words(
+    words: Iterable[tuple[str, str]],
+) -> tuple[list[IndexEntry], int, list[str]]:
+    """Select readings for and analyze (surface, dictionary reading) pairs.
+
+    Runs in worker processes, so it returns error messages instead of printing them.
+
+    Returns:
+        Tuple of (entries with vowels, number of Sudachi readings used, error messages)
+    """
+    entries: list[IndexEntry] = []
+    used_sudachi = 0
+    errors: list[str] = []
+
+    for word, dict_reading in words:
+        # Select reading using hybrid approach
+        reading = select_reading(dict_reading, word)
+        if reading != dict_reading:
+            used_sudachi += 1
+
+        try:
+            phoneme_analysis = analyze(reading)
+        except Exception as e:
+            errors.append(f"Error processing {word}: {e}")
+            continue
+
+        if phoneme_analysis.vowels:
+            entries.append(
+                IndexEntry(
+                    word=word,
+                    reading=reading,
+                    vowels=phoneme_analysis.vowels,
+                    consonants=phoneme_analysis.consonants,
+                    mora_count=phoneme_analysis.mora_count,
+                    initial_consonant=phoneme_analysis.initial_consonant,
+                )
+            )
+
+    return entries, used_sudachi, errors
+
+
+def _merge_first_readings(
+    first_readings: dict[str, str], words: Iterable[tuple[str, str]], source: str
+) -> None:
+    """Add (surface, reading) pairs to first_readings, keeping the first reading per surface.
+
+    Within a source and across sources this is the only dedup pass; each surface is hashed
+    once by setdefault.
+    """
+    before = len(first_readings)
+    for surface, reading in words:
+        first_readings.setdefault(surface, reading)
+    print(f"  {source}: {len(first_readings) - before} new unique words")
+
+
 def build_sqlite_index(
     output_path: str = "data/rhyme_index.db",
     include_ipadic: bool = True,
@@ -367,87 +479,75 @@ def build_sqlite_index(
     """Build SQLite rhyme index from NEologd seed data and optionally IPADIC/JMdict."""
     cache_dir = Path("/tmp/neologd_cache")
 
-    print("Downloading NEologd seed data...")
-    words = get_neologd_words(cache_dir)
-    print(f"NEologd unique words: {len(words)}")
+    # Sources stream into one dict in priority order (NEologd, IPADIC, JMdict), so the first
+    # occurrence of a surface wins. Deduplicating before analysis means Sudachi never runs
+    # on a surface that would be dropped. This dedup is also what keeps the bulk load unique:
+    # the idx_word UNIQUE index is only built after the load and enforces it from then on.
+    first_readings: dict[str, str] = {}
 
-    existing_surfaces = {w[0] for w in words}
+    print("Downloading NEologd seed data...")
+    _merge_first_readings(first_readings, get_neologd_words(cache_dir), "NEologd")
 
     if include_ipadic:
         print("\nDownloading IPADIC data...")
-        ipadic_words = get_ipadic_words(cache_dir)
-
-        # Merge: NEologd takes priority, add IPADIC words not in NEologd
-        added_from_ipadic = 0
-        for surface, reading in ipadic_words:
-            if surface not in existing_surfaces:
-                words.append((surface, reading))
-                existing_surfaces.add(surface)
-                added_from_ipadic += 1
-        print(f"Added {added_from_ipadic} words from IPADIC")
+        _merge_first_readings(first_readings, get_ipadic_words(cache_dir), "IPADIC")
 
     if include_jmdict:
         print("\nDownloading JMdict data...")
-        jmdict_words = get_jmdict_words(cache_dir)
-
-        # Merge: add JMdict words not already in dictionary
-        added_from_jmdict = 0
-        for surface, reading in jmdict_words:
-            if surface not in existing_surfaces:
-                words.append((surface, reading))
-                existing_surfaces.add(surface)
-                added_from_jmdict += 1
-        print(f"Added {added_from_jmdict} words from JMdict")
+        _merge_first_readings(first_readings, get_jmdict_words(cache_dir), "JMdict")
 
-    print(f"Total unique words: {len(words)}")
+    total = len(first_readings)
+    print(f"Total unique words: {total}")
 
     output = Path(output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
 
-    if output.exists():
-        output.unlink()
+    # Build next to the target and swap it in at the end: an existing index stays intact
+    # until the new one is complete, and the rename is atomic on the same filesystem
+    build_path = output.with_name(f"{output.name}.build")
+    build_path.unlink(missing_ok=True)
 
     print(f"Building SQLite index: {output_path}")
-    index = RhymeIndex(db_path=output_path)
-    index.init_db()
-
-    indexed = 0
-    used_dict = 0
-    used_sudachi = 0
-    error_count = 0
-    for i, (word, dict_reading) in enumerate(words):
-        if i % 50000 == 0:
-            print(f"Processing {i}/{len(words)}...")
-
-        # Select reading using hybrid approach
-        reading = select_reading(dict_reading, word)
-        if reading == dict_reading:
-            used_dict += 1
-        else:
-            used_sudachi += 1
-
-        try:
-            phoneme_analysis = analyze(reading)
-            if phoneme_analysis.vowels:
-                entry = IndexEntry(
-                    word=word,
-                    reading=reading,
-                    vowels=phoneme_analysis.vowels,
-                    consonants=phoneme_analysis.consonants,
-                    mora_count=phoneme_analysis.mora_count,
-                    initial_consonant=phoneme_analysis.initial_consonant,
-                )
-                index.add_entry_to_db(entry)
-                indexed += 1
-        except Exception as e:
-            error_count += 1
-            print(f"Error processing {word}: {e}")
-            if error_count > MAX_ERRORS:
-                raise RuntimeError(f"Too many errors ({error_count}), aborting") from e
-            continue
-
-    index.commit()
-    index.close()
+    index = RhymeIndex(db_path=str(build_path))
+    try:
+        index.enable_bulk_load()
+        index.init_db(with_indexes=False)
+
+        # Reading selection (Sudachi) and phoneme analysis are CPU-bound, so they run in worker
+        # processes. map preserves input order, which keeps the first-occurrence-wins dedup.
+        chunks = batched(first_readings.items(), ANALYSIS_CHUNK_SIZE)
+
+        indexed = 0
+        used_sudachi = 0
+        error_count = 0
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(analyze_words, chunks, chunksize=4)
+            for i, (entries, chunk_sudachi, chunk_errors) in enumerate(results):
+                processed = i * ANALYSIS_CHUNK_SIZE
+                if processed % 50000 == 0:
+                    print(f"Processing {processed}/{total}...")
+
+                used_sudachi += chunk_sudachi
+                for message in chunk_errors:
+                    error_count += 1
+                    print(message)
+                if error_count > MAX_ERRORS:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise RuntimeError(f"Too many errors ({error_count}), aborting")
+
+                indexed += index.add_entries_bulk(entries)
+
+        used_dict = total - used_sudachi
+
+        index.commit()
+        index.create_indexes()
+        index.close()
+        build_path.replace(output)
+    except BaseException:
+        # Keep any existing index in place and drop the partial build
+        index.close()
+        build_path.unlink(missing_ok=True)
+        raise
 
     size_mb = output.stat().st_size / (1024 * 1024)
     print(f"Done! Indexed {indexed} words")
@@ -523,21 +623,25 @@ def build_sample_index(output_path: str = "data/rhyme_index.db") -> None:
 
     print(f"Building sample SQLite index: {output_path}")
     index = RhymeIndex(db_path=output_path)
-    index.init_db()
+    index.init_db(with_indexes=False)
 
+    entries = []
     for word, reading in words:
         phoneme_analysis = analyze(reading)
-        entry = IndexEntry(
-            word=word,
-            reading=reading,
-            vowels=phoneme_analysis.vowels,
-            consonants=phoneme_analysis.consonants,
-            mora_count=phoneme_analysis.mora_count,
-            initial_consonant=phoneme_analysis.initial_consonant,
+        entries.append(
+            IndexEntry(
+                word=word,
+                reading=reading,
+                vowels=phoneme_analysis.vowels,
+                consonants=phoneme_analysis.consonants,
+                mora_count=phoneme_analysis.mora_count,
+                initial_consonant=phoneme_analysis.initial_consonant,
+            )
         )
-        index.add_entry_to_db(entry)
 
+    index.add_entries_bulk(entries)
     index.commit()
+    index.create_indexes()
     index.close()
     print(f"Done! Indexed {len(words)} sample words")
 
@@ -557,12 +661,14 @@ def add_words_to_index(
     """
     index = RhymeIndex(db_path=db_path)
 
-    # Get existing words using iterator to avoid loading all into memory
+    # Look up only the candidate surfaces (one bound JSON array, so no variable limit)
+    # instead of scanning every word in the table
     conn = index._get_conn()
-    cursor = conn.execute("SELECT word FROM words")
+    candidates = json.dumps([word for word, _reading in words], ensure_ascii=False)
+    cursor = conn.execute(_SQL_EXISTING_WORDS, (candidates,))
     existing = {row[0] for row in cursor}
 
-    added = 0
+    entries: list[IndexEntry] = []
     for word, reading in words:
         if word in existing:
             continue
@@ -578,12 +684,12 @@ def add_words_to_index(
                     mora_count=phoneme_analysis.mora_count,
                     initial_consonant=phoneme_analysis.initial_consonant,
                 )
-                index.add_entry_to_db(entry)
-                added += 1
+                entries.append(entry)
                 print(f"  Added: {word} ({reading})")
         except Exception as e:
             print(f"  Error: {word} - {e}")
 
+    added = index.add_entries_bulk(entries)
     index.commit()
     index.close()
     return added
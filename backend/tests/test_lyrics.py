@@ -1,12 +1,37 @@
+from collections.abc import Iterator
+
+import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.models.schemas import LyricsAnalyzeRequest
+from app.routers.lyrics import analyze_lyrics, analyze_phoneme
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """Start the app (including lifespan) once for the whole test session."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+# Most tests only check the analysis result, so they call the handlers directly and
+# leave the HTTP layer to a smoke test and the validation tests per endpoint
+def _analyze(text: str) -> dict:
+    return analyze_lyrics(LyricsAnalyzeRequest(text=text)).model_dump()
+
 
-client = TestClient(app)
+def _phoneme(text: str) -> dict:
+    return analyze_phoneme(LyricsAnalyzeRequest(text=text)).model_dump()
+
+
+def _by_surface(words: list[dict]) -> dict[str, dict]:
+    """Index analyzed words by surface (surfaces are unique in a response)."""
+    return {w["surface"]: w for w in words}
 
 
 class TestLyricsAnalyze:
-    def test_analyze_simple_text(self) -> None:
+    def test_analyze_simple_text(self, client: TestClient) -> None:
         response = client.post(
             "/api/lyrics/analyze",
             json={"text": "東京の空は青い"},
@@ -18,17 +43,12 @@ class TestLyricsAnalyze:
         assert len(data["words"]) > 0
 
     def test_analyze_returns_vowel_patterns(self) -> None:
-        response = client.post(
-            "/api/lyrics/analyze",
-            json={"text": "東京"},
-        )
-        data = response.json()
-        words = data["words"]
-        tokyo = next((w for w in words if w["surface"] == "東京"), None)
+        data = _analyze("東京")
+        tokyo = _by_surface(data["words"]).get("東京")
         assert tokyo is not None
         assert tokyo["vowel_pattern"] != ""
 
-    def test_empty_text_rejected(self) -> None:
+    def test_empty_text_rejected(self, client: TestClient) -> None:
         response = client.post(
             "/api/lyrics/analyze",
             json={"text": ""},
@@ -36,43 +56,27 @@ class TestLyricsAnalyze:
         assert response.status_code == 422
 
     def test_filters_particles(self) -> None:
-        response = client.post(
-            "/api/lyrics/analyze",
-            json={"text": "東京の空"},
-        )
-        data = response.json()
-        surfaces = [w["surface"] for w in data["words"]]
+        data = _analyze("東京の空")
+        surfaces = _by_surface(data["words"])
         assert "の" not in surfaces
 
     def test_filters_single_vowel_words(self) -> None:
         """Words with only 1 vowel have no rhyme value and should be filtered."""
-        response = client.post(
-            "/api/lyrics/analyze",
-            json={"text": "待ってましたと言わんばかりの"},
-        )
-        data = response.json()
-        surfaces = [w["surface"] for w in data["words"]]
+        data = _analyze("待ってましたと言わんばかりの")
+        surfaces = _by_surface(data["words"])
         # 待っ(まっ) has only 1 vowel 'a' - should be excluded
         assert "待っ" not in surfaces
 
     def test_filters_grammatical_pos(self) -> None:
         """接尾辞, 連体詞, 接続詞 should be filtered."""
-        response = client.post(
-            "/api/lyrics/analyze",
-            json={"text": "この世界はまた素晴らしい"},
-        )
-        data = response.json()
-        surfaces = [w["surface"] for w in data["words"]]
+        data = _analyze("この世界はまた素晴らしい")
+        surfaces = _by_surface(data["words"])
         assert "この" not in surfaces  # 連体詞
 
     def test_split_mode_b_separates_compounds(self) -> None:
         """SplitMode.B should separate '東京の空' into '東京' and '空'."""
-        response = client.post(
-            "/api/lyrics/analyze",
-            json={"text": "東京の空は青い"},
-        )
-        data = response.json()
-        surfaces = [w["surface"] for w in data["words"]]
+        data = _analyze("東京の空は青い")
+        surfaces = _by_surface(data["words"])
         assert "東京" in surfaces
         assert "空" in surfaces
         # Should NOT be merged into one token
@@ -80,36 +84,24 @@ class TestLyricsAnalyze:
 
     def test_dictionary_form_included(self) -> None:
         """Words should include dictionary/base form."""
-        response = client.post(
-            "/api/lyrics/analyze",
-            json={"text": "夢を追いかけて走る"},
-        )
-        data = response.json()
-        oikake = next((w for w in data["words"] if w["surface"] == "追いかけ"), None)
+        data = _analyze("夢を追いかけて走る")
+        oikake = _by_surface(data["words"]).get("追いかけ")
         assert oikake is not None
         assert oikake["dictionary_form"] == "追いかける"
 
     def test_rhyme_groups_detected(self) -> None:
         """Words with matching vowel suffixes should be grouped."""
-        response = client.post(
-            "/api/lyrics/analyze",
-            json={"text": "光と夢 走る星 僕の空"},
-        )
-        data = response.json()
+        data = _analyze("光と夢 走る星 僕の空")
         assert "rhyme_groups" in data
 
     def test_rhyme_groups_require_two_words(self) -> None:
         """A rhyme group needs at least 2 words."""
-        response = client.post(
-            "/api/lyrics/analyze",
-            json={"text": "光"},
-        )
-        data = response.json()
+        data = _analyze("光")
         assert data["rhyme_groups"] == []
 
 
 class TestLyricsPhoneme:
-    def test_phoneme_returns_vowel_pattern(self) -> None:
+    def test_phoneme_returns_vowel_pattern(self, client: TestClient) -> None:
         response = client.post(
             "/api/lyrics/phoneme",
             json={"text": "東京"},
@@ -120,14 +112,10 @@ class TestLyricsPhoneme:
         assert data["vowel_pattern"] != ""
 
     def test_phoneme_with_phrase(self) -> None:
-        response = client.post(
-            "/api/lyrics/phoneme",
-            json={"text": "待ってました"},
-        )
-        data = response.json()
+        data = _phoneme("待ってました")
         assert "-" in data["vowel_pattern"]
 
-    def test_phoneme_empty_text(self) -> None:
+    def test_phoneme_empty_text(self, client: TestClient) -> None:
         response = client.post(
             "/api/lyrics/phoneme",
             json={"text": ""},
@@ -1,3 +1,5 @@
+import pytest
+
 from app.services.phoneme import (
     analyze,
     extract_phonemes,
@@ -37,9 +39,9 @@ class TestExtractPhonemes:
         vowels = [p.vowel for p in phonemes]
         assert vowels == ["i", "o", None]
 
-    def test_all_youon_consonants(self) -> None:
-        """Test all supported youon (拗音) consonants"""
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("kana", "expected_cons", "expected_vowel"),
+        [
             ("キャ", "ky", "a"),
             ("キュ", "ky", "u"),
             ("キョ", "ky", "o"),
@@ -73,12 +75,14 @@ class TestExtractPhonemes:
             ("リャ", "ry", "a"),
             ("リュ", "ry", "u"),
             ("リョ", "ry", "o"),
-        ]
-        for kana, expected_cons, expected_vowel in test_cases:
-            phonemes = extract_phonemes(kana)
-            assert len(phonemes) == 1, f"Expected 1 phoneme for {kana}"
-            assert phonemes[0].consonant == expected_cons, f"Consonant mismatch for {kana}"
-            assert phonemes[0].vowel == expected_vowel, f"Vowel mismatch for {kana}"
+        ],
+    )
+    def test_all_youon_consonants(self, kana: str, expected_cons: str, expected_vowel: str) -> None:
+        """Test all supported youon (拗音) consonants"""
+        phonemes = extract_phonemes(kana)
+        assert len(phonemes) == 1
+        assert phonemes[0].consonant == expected_cons
+        assert phonemes[0].vowel == expected_vowel
 
     def test_sokuon(self) -> None:
         """Test sokuon (促音) っ handling"""
@@ -166,10 +170,16 @@ class TestAnalyze:
 
 
 class TestKatakanaToHiragana:
-    def test_basic_conversion(self) -> None:
-        assert katakana_to_hiragana("トウキョウ") == "とうきょう"
-        assert katakana_to_hiragana("ラップ") == "らっぷ"
-        assert katakana_to_hiragana("アイウエオ") == "あいうえお"
+    @pytest.mark.parametrize(
+        ("katakana", "expected"),
+        [
+            ("トウキョウ", "とうきょう"),
+            ("ラップ", "らっぷ"),
+            ("アイウエオ", "あいうえお"),
+        ],
+    )
+    def test_basic_conversion(self, katakana: str, expected: str) -> None:
+        assert katakana_to_hiragana(katakana) == expected
 
     def test_mixed_text(self) -> None:
         # Non-katakana characters should remain unchanged
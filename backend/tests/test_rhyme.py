@@ -1,3 +1,5 @@
+import logging
+
 import pytest
 
 from app.services.pattern import PatternMatcher, build_pattern_from_reading
@@ -74,6 +76,91 @@ class TestRhymeIndex:
         results = index.search_by_vowels("o-u")
         assert len(results) == 2
 
+    def test_save_and_load_restores_postings(self, tmp_path) -> None:
+        index = RhymeIndex()
+        index.add_entry(
+            IndexEntry(word="東京", reading="トウキョウ", vowels="o-u-o-u", consonants="t-ky")
+        )
+        index.add_entry(IndexEntry(word="草", reading="クサ", vowels="u-a", consonants="k-s"))
+        path = str(tmp_path / "index.json")
+        index.save(path)
+
+        loaded = RhymeIndex()
+        loaded.load(path)
+        assert [r.word for r in loaded.search_by_vowels("o-u")] == ["東京"]
+        assert [r.word for r in loaded.search_by_consonants_prefix("k")] == ["草"]
+
+    def test_bulk_insert_keeps_first_entry_per_word(self, tmp_path) -> None:
+        index = RhymeIndex(db_path=str(tmp_path / "index.db"))
+        index.init_db()
+
+        added = index.add_entries_bulk(
+            [
+                IndexEntry(word="東京", reading="トウキョウ", vowels="o-u-o-u", consonants="t-k"),
+                IndexEntry(
+                    word="東京", reading="ヒガシキョウ", vowels="i-a-i-o-u", consonants="h-g-s-k"
+                ),
+                IndexEntry(word="草", reading="クサ", vowels="u-a", consonants="k-s"),
+            ]
+        )
+        index.commit()
+
+        assert added == 2
+        assert [r.reading for r in index.get_all_entries()] == ["トウキョウ", "クサ"]
+        index.close()
+
+    def test_unique_word_index_built_after_bulk_load(self, tmp_path) -> None:
+        index = RhymeIndex(db_path=str(tmp_path / "index.db"))
+        index.init_db(with_indexes=False)
+        conn = index._get_conn()
+        assert conn.execute("PRAGMA index_list(words)").fetchall() == []
+
+        entry = IndexEntry(word="草", reading="クサ", vowels="u-a", consonants="k-s")
+        assert index.add_entries_bulk([entry]) == 1
+        index.create_indexes()
+
+        unique = {row["name"] for row in conn.execute("PRAGMA index_list(words)") if row["unique"]}
+        assert unique == {"idx_word"}
+        # Once the index exists, INSERT OR IGNORE keeps the first entry for a surface
+        duplicate = IndexEntry(word="草", reading="ソウ", vowels="o-u", consonants="s")
+        assert index.add_entries_bulk([duplicate]) == 0
+        assert [r.reading for r in index.get_all_entries()] == ["クサ"]
+        index.close()
+
+    def test_db_prefix_and_suffix_search(self, tmp_path) -> None:
+        index = RhymeIndex(db_path=str(tmp_path / "index.db"))
+        index.init_db()
+        index.add_entries_bulk(
+            [
+                IndexEntry(word="東京", reading="トウキョウ", vowels="o-u-o-u", consonants="t-ky"),
+                IndexEntry(word="草", reading="クサ", vowels="u-a", consonants="k-s"),
+                IndexEntry(word="朝", reading="アサ", vowels="a-a", consonants="s"),
+            ]
+        )
+        index.commit()
+
+        assert [r.word for r in index.search_by_vowels("u-a")] == ["草"]
+        assert [r.word for r in index.search_by_vowels_prefix("o-u")] == ["東京"]
+        assert [r.word for r in index.search_by_consonants_prefix("k")] == ["草"]
+        suffix = index.search_by_pattern(vowel_pattern="a", consonant_pattern="s", suffix=True)
+        assert sorted(r.word for r in suffix) == ["朝", "草"]
+        index.close()
+
+    def test_memory_pattern_search_uses_postings(self) -> None:
+        index = RhymeIndex()
+        index.add_entry(
+            IndexEntry(word="東京", reading="トウキョウ", vowels="o-u-o-u", consonants="t-ky")
+        )
+        index.add_entry(IndexEntry(word="草", reading="クサ", vowels="u-a", consonants="k-s"))
+        index.add_entry(IndexEntry(word="朝", reading="アサ", vowels="a-a", consonants="s"))
+
+        suffix = index.search_by_pattern(vowel_pattern="a", consonant_pattern="s", suffix=True)
+        assert [r.word for r in suffix] == ["草", "朝"]
+        prefix = index.search_by_pattern(vowel_pattern="o-u", prefix=True)
+        assert [r.word for r in prefix] == ["東京"]
+        # Contains patterns are not indexed and fall back to scanning every entry
+        assert len(index.search_by_pattern(vowel_pattern="u")) == 3
+
 
 class TestPatternMatcher:
     @pytest.fixture
@@ -120,6 +207,24 @@ class TestPatternMatcher:
         assert parsed.phoneme_patterns[1].consonant is None
         assert parsed.phoneme_patterns[1].vowel == "a"
 
+    def test_parse_result_is_shared(self) -> None:
+        # Parsed patterns are immutable, so repeated parses reuse one result
+        parsed = PatternMatcher().parse("*kusa")
+        assert PatternMatcher().parse("*kusa") is parsed
+        with pytest.raises(AttributeError):
+            parsed.prefix_wildcard = False
+
+    def test_unknown_character_warned_on_every_parse(self, caplog) -> None:
+        # Parses are cached, but the warning must not be limited to the first (uncached) call
+        with caplog.at_level(logging.WARNING, logger="app.services.pattern"):
+            first = PatternMatcher().parse("*ku#sa")
+            second = PatternMatcher().parse("*ku#sa")
+        assert second is first
+        assert [r.getMessage() for r in caplog.records] == [
+            "Unknown character in pattern: '#'",
+            "Unknown character in pattern: '#'",
+        ]
+
     def test_match_suffix_exact(
         self, matcher: PatternMatcher, index_with_entries: RhymeIndex
     ) -> None:
@@ -134,6 +239,14 @@ class TestPatternMatcher:
         matches, _ = matcher.match(asa_entry, parsed)
         assert matches is False
 
+    def test_match_score_reflects_specificity(
+        self, matcher: PatternMatcher, index_with_entries: RhymeIndex
+    ) -> None:
+        kusa_entry = next(e for e in index_with_entries.get_all_entries() if e.word == "草")
+        assert matcher.match(kusa_entry, matcher.parse("*kusa")) == (True, 100)
+        assert matcher.match(kusa_entry, matcher.parse("*_u_a")) == (True, 75)
+        assert matcher.match(kusa_entry, matcher.parse("*__")) == (True, 100)
+
     def test_match_vowel_pattern_ua(
         self, matcher: PatternMatcher, index_with_entries: RhymeIndex
     ) -> None:
@@ -1,3 +1,5 @@
+import pytest
+
 from app.services.pattern import PatternMatcher
 from app.services.search_utils import extract_patterns, word_priority
 
@@ -15,6 +17,11 @@ class TestWordPriority:
         priority = word_priority("123")
         assert priority[0] == -1
 
+    @pytest.mark.parametrize("word", ["東京②", "東京\U0001f101", "東京\U00010a40"])
+    def test_non_ascii_digit_low_priority(self, word: str) -> None:
+        # Any str.isdigit() character counts as a digit, including ones outside the BMP
+        assert word_priority(word)[0] == -1
+
     def test_shorter_preferred(self) -> None:
         p1 = word_priority("東")
         p2 = word_priority("東京都")
@@ -37,3 +44,26 @@ class TestExtractPatterns:
         assert vowel == "u-a"
         assert is_prefix is True
         assert is_suffix is False
+
+    def test_suffix_pattern_with_trailing_wildcard(self) -> None:
+        # The last phoneme is unknown, so no vowel suffix can be used for filtering
+        matcher = PatternMatcher()
+        parsed = matcher.parse("*ka_")
+        vowel, consonant, _, is_suffix = extract_patterns(parsed)
+        assert vowel is None
+        assert consonant is None
+        assert is_suffix is True
+
+    def test_consonants_collected_past_vowel_wildcard(self) -> None:
+        matcher = PatternMatcher()
+        parsed = matcher.parse("*k_sa")
+        vowel, consonant, _, _ = extract_patterns(parsed)
+        assert vowel == "a"
+        assert consonant == "k-s"
+
+    def test_hatsuon_has_no_vowel(self) -> None:
+        matcher = PatternMatcher()
+        parsed = matcher.parse("*kaN")
+        vowel, consonant, _, _ = extract_patterns(parsed)
+        assert vowel == "a"
+        assert consonant == "k-N"
@@ -1,3 +1,5 @@
+import pytest
+
 from app.services.similarity import calculate_similarity
 
 
@@ -75,3 +77,15 @@ class TestCalculateSimilarity:
             result_mora=0,
         )
         assert 0.0 <= score <= 1.0
+
+    def test_identical_patterns_with_empty_tokens(self) -> None:
+        # Empty tokens never count as matches, even when both patterns are identical
+        score = calculate_similarity(
+            input_vowels="a--i",
+            input_consonants="",
+            result_vowels="a--i",
+            result_consonants="",
+            input_mora=2,
+            result_mora=2,
+        )
+        assert score == pytest.approx(0.8)